@@ -2,8 +2,10 @@
 Application Configuration
 Manages environment variables and settings using Pydantic
 """
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from typing import List
+from functools import cached_property, lru_cache
+from typing import List, Tuple
 import os
 
 
@@ -25,14 +27,20 @@ class Settings(BaseSettings):
     DATABASE_URL: str
     DB_POOL_SIZE: int = 10
     DB_MAX_OVERFLOW: int = 20
+    DB_POOL_PRE_PING: bool = True  # Disable only when DB_POOL_RECYCLE is below the server idle timeout
+    DB_POOL_RECYCLE: int = 300  # Seconds before a pooled connection is replaced
     
-    # CORS (comma-separated string)
+    # CORS (comma-separated string, tokenized once at load)
     CORS_ORIGINS: str = "http://localhost:3000,http://localhost:5173"
+    CORS_ORIGINS_PARSED: Tuple[str, ...] = ()
     
-    @property
-    def cors_origins_list(self) -> List[str]:
-        """Get CORS origins as list"""
-        return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
+    @model_validator(mode="after")
+    def parse_cors_origins(self) -> "Settings":
+        """Split CORS_ORIGINS into a tuple once at construction"""
+        self.CORS_ORIGINS_PARSED = tuple(
+            origin.strip() for origin in self.CORS_ORIGINS.split(",") if origin.strip()
+        )
+        return self
     
     # File Upload
     UPLOAD_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "uploads")
@@ -40,6 +48,7 @@ class Settings(BaseSettings):
     MAX_IMAGE_SIZE: int = 1048576  # 1MB
     ALLOWED_IMAGE_TYPES: str = "image/jpeg,image/png,image/jpg"
     ALLOWED_DOCUMENT_TYPES: str = "application/pdf"
+    KNOWN_DOC_TYPES: Tuple[str, ...] = ("general", "compliance", "policy", "accreditation", "quality")
     
     # Storage
     STORAGE_TYPE: str = "local"  # local or s3
@@ -60,16 +69,25 @@ class Settings(BaseSettings):
         extra='ignore'  # Ignore extra fields in .env
     )
     
-    @property
+    @cached_property
     def allowed_image_types_list(self) -> List[str]:
         """Get allowed image types as list"""
         return [t.strip() for t in self.ALLOWED_IMAGE_TYPES.split(",")]
     
-    @property
+    @cached_property
     def allowed_document_types_list(self) -> List[str]:
         """Get allowed document types as list"""
         return [t.strip() for t in self.ALLOWED_DOCUMENT_TYPES.split(",")]
 
 
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Get the settings instance (.env is read and validated only once per process)
+    Usage: settings: Settings = Depends(get_settings)
+    """
+    return Settings()
+
+
 # Create settings instance
-settings = Settings()
+settings = get_settings()
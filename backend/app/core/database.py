@@ -2,7 +2,7 @@
 Database Configuration
 SQLAlchemy setup for Neon PostgreSQL
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import Generator
@@ -13,12 +13,23 @@ from app.core.config import settings
 # Suppress verbose SQLAlchemy logs (only show warnings and errors)
 logging.getLogger('sqlalchemy.engine').setLevel(logging.WARNING)
 
+# psycopg2-only executemany tuning: multi-row VALUES for INSERT (already the default)
+# plus execute_batch for executemany UPDATEs such as the ORM bulk updates in services
+DRIVER_OPTIONS = (
+    {"executemany_mode": "values_plus_batch", "executemany_batch_page_size": 500}
+    if make_url(settings.DATABASE_URL).get_dialect().driver == "psycopg2"
+    else {}
+)
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
+    insertmanyvalues_page_size=1000,  # Rows per multi-row INSERT batch
+    **DRIVER_OPTIONS,
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_pre_ping=True,  # Verify connections before using
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # Verify connections before using
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections before the server drops them
     echo=False  # Disable SQL query logging completely
 )
 
@@ -26,6 +37,7 @@ engine = create_engine(
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,  # Committed objects keep their loaded state; refresh explicitly
     bind=engine
 )
 
@@ -3,18 +3,13 @@ Common Dependencies
 Reusable dependencies for FastAPI routes
 """
 from fastapi import Depends, HTTPException, status
-from sqlalchemy.orm import Session
 from typing import Optional
 
-from app.core.database import get_db
 
-
-async def get_current_user(
-    db: Session = Depends(get_db)
-) -> Optional[dict]:
+async def get_current_user() -> Optional[dict]:
     """
     Get current authenticated user
-    TODO: Implement JWT authentication
+    TODO: Implement JWT authentication (add the db session dependency back then)
     """
     # Placeholder for authentication
     # In production, verify JWT token and return user
@@ -23,7 +18,6 @@ async def get_current_user(
 
 async def verify_organization_access(
     organization_id: str,
-    db: Session = Depends(get_db),
     current_user: Optional[dict] = Depends(get_current_user)
 ) -> bool:
     """
@@ -3,6 +3,7 @@ Main FastAPI Application Entry Point
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from contextlib import asynccontextmanager
 import os
@@ -40,13 +41,15 @@ async def lifespan(app: FastAPI):
     # Startup
     print("[+] Starting up LMS Backend...")
     
-    # Create upload directories if they don't exist
-    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    # Create upload subdirectories if they don't exist
     os.makedirs(os.path.join(settings.UPLOAD_DIR, "logos"), exist_ok=True)
     os.makedirs(os.path.join(settings.UPLOAD_DIR, "documents"), exist_ok=True)
+    for doc_type in settings.KNOWN_DOC_TYPES:
+        os.makedirs(os.path.join(settings.UPLOAD_DIR, "documents", doc_type), exist_ok=True)
     
-    # Create database tables (in production, use Alembic migrations)
-    Base.metadata.create_all(bind=engine)
+    # Create database tables in development only (in production, use Alembic migrations)
+    if settings.ENVIRONMENT == "development":
+        Base.metadata.create_all(bind=engine)
     
     print("[+] Startup complete!")
     
@@ -64,28 +67,32 @@ app = FastAPI(
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # CORS Middleware - Allow all localhost ports for development
+# Origins are deduplicated (order preserved) so each preflight scans the shortest list
+CORS_ALLOWED_ORIGINS = tuple(dict.fromkeys([
+    "http://localhost:5173",
+    "http://localhost:5174",
+    "http://127.0.0.1:5173",
+    "http://127.0.0.1:5174",
+    "http://localhost:3000",
+    *settings.CORS_ORIGINS_PARSED  # Include origins from .env
+]))
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",
-        "http://localhost:5174", 
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:5174",
-        "http://localhost:3000",
-        *settings.cors_origins_list  # Include origins from .env
-    ],
+    allow_origins=CORS_ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
-# Mount static files for uploads
-if os.path.exists(settings.UPLOAD_DIR):
-    app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+# Mount static files for uploads (directory must exist before StaticFiles is created)
+os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # Include routers
 app.include_router(
@@ -4,12 +4,46 @@ Endpoints for file upload and management
 """
 from fastapi import APIRouter, UploadFile, File, HTTPException, status
 from typing import List
+import asyncio
 
+from app.core.config import settings
 from app.modules.files.storage import FileStorageService
+from app.utils.helpers import clean_filename
 
 router = APIRouter()
 
 
+def check_doc_type(doc_type: str) -> None:
+    """Reject document types outside settings.KNOWN_DOC_TYPES (each maps to an upload folder)"""
+    if doc_type not in settings.KNOWN_DOC_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown document type '{doc_type}'. Allowed: {', '.join(settings.KNOWN_DOC_TYPES)}"
+        )
+
+
+def unique_filenames(files: List[UploadFile]) -> List[str]:
+    """
+    Storage names for a batch of uploads, numbering repeated names (doc.pdf, doc_1.pdf, ...)
+    so files saved concurrently never share a target path. Names are compared after
+    cleaning, since e.g. "doc!.pdf" and "doc.pdf" are stored under the same name
+    """
+    names = []
+    used = set()
+    for file in files:
+        name = clean_filename(file.filename)
+        stem, dot, ext = name.rpartition(".")
+        if not dot:
+            stem, ext = name, ""
+        count = 0
+        while name in used:
+            count += 1
+            name = f"{stem}_{count}.{ext}" if dot else f"{stem}_{count}"
+        used.add(name)
+        names.append(name)
+    return names
+
+
 @router.post("/upload/logo")
 async def upload_logo(
     file: UploadFile = File(...),
@@ -48,6 +82,7 @@ async def upload_document(
     - **doc_type**: Type of document (general, compliance, policy, etc.)
     - **organization_id**: Optional organization ID to prefix filename
     """
+    check_doc_type(doc_type)
     try:
         file_url = await FileStorageService.save_document(file, doc_type, organization_id)
         return {
@@ -76,26 +111,50 @@ async def upload_multiple_files(
     - **doc_type**: Type of documents
     - **organization_id**: Optional organization ID to prefix filenames
     """
+    check_doc_type(doc_type)
     try:
-        uploaded_files = []
+        # Save all files concurrently, each under its own name
+        results = await asyncio.gather(
+            *(
+                FileStorageService.save_document(file, doc_type, organization_id, filename=name)
+                for file, name in zip(files, unique_filenames(files))
+            ),
+            return_exceptions=True
+        )
         
-        for file in files:
-            file_url = await FileStorageService.save_document(file, doc_type, organization_id)
-            uploaded_files.append({
-                "file_url": file_url,
-                "filename": file.filename
-            })
+        uploaded_files = []
+        failed_files = []
         
-        return {
-            "success": True,
-            "files": uploaded_files,
-            "count": len(uploaded_files)
-        }
+        for file, result in zip(files, results):
+            if isinstance(result, Exception):
+                failed_files.append({
+                    "filename": file.filename,
+                    "error": getattr(result, "detail", str(result))
+                })
+            else:
+                uploaded_files.append({
+                    "file_url": result,
+                    "filename": file.filename
+                })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
+    
+    # Nothing saved: fail the request; a partial success still returns 200 with "failed"
+    if not uploaded_files:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=failed_files
+        )
+    
+    return {
+        "success": not failed_files,
+        "files": uploaded_files,
+        "count": len(uploaded_files),
+        "failed": failed_files
+    }
 
 
 @router.delete("/delete")
@@ -3,24 +3,57 @@ File Storage Service
 Handles file upload, storage, and retrieval
 """
 import os
-import shutil
-from typing import Optional
+from typing import Dict, Optional
 from fastapi import UploadFile
 from pathlib import Path
+import aiofiles
 
 from app.core.config import settings
 from app.utils.helpers import sanitize_filename, get_file_extension
 from app.utils.exceptions import FileUploadException
 
+# Allowed content types, parsed once at import
+ALLOWED_IMAGE_TYPES = frozenset(settings.allowed_image_types_list)
+ALLOWED_DOCUMENT_TYPES = frozenset(settings.allowed_document_types_list)
+
+# Size limits per file type, with the error message prepared once
+IMAGE_SIZE_LIMIT = (
+    settings.MAX_IMAGE_SIZE,
+    f"File size exceeds {settings.MAX_IMAGE_SIZE / (1024 * 1024)}MB limit"
+)
+DOCUMENT_SIZE_LIMIT = (
+    settings.MAX_FILE_SIZE,
+    f"File size exceeds {settings.MAX_FILE_SIZE / (1024 * 1024)}MB limit"
+)
+
+# Read/write uploads in 64KB chunks so the event loop is never blocked on a whole file
+CHUNK_SIZE = 1 << 16
+
+# Upload directory per known subfolder, resolved once at import; nothing else is served
+UPLOAD_SUBFOLDERS: Dict[str, Path] = {
+    subfolder: Path(settings.UPLOAD_DIR) / subfolder
+    for subfolder in (
+        "logos",
+        "documents",
+        *(f"documents/{doc_type}" for doc_type in settings.KNOWN_DOC_TYPES),
+    )
+}
+
 
 class FileStorageService:
     """Service for file storage operations"""
     
     @staticmethod
-    def validate_file(file: UploadFile, file_type: str = "document") -> bool:
+    def validate_file(
+        file: UploadFile,
+        file_type: str = "document"
+    ) -> bool:
         """
         Validate uploaded file
         
+        When the size is unknown up front, it is enforced while streaming the upload
+        to disk in save_file.
+        
         Args:
             file: Uploaded file
             file_type: Type of file (image or document)
@@ -31,23 +64,17 @@ class FileStorageService:
         Raises:
             FileUploadException: If validation fails
         """
-        # Check file size
-        max_size = settings.MAX_IMAGE_SIZE if file_type == "image" else settings.MAX_FILE_SIZE
-        
-        # Get file size (this is an approximation)
-        file.file.seek(0, 2)  # Seek to end
-        file_size = file.file.tell()
-        file.file.seek(0)  # Reset to beginning
-        
-        if file_size > max_size:
-            max_mb = max_size / (1024 * 1024)
-            raise FileUploadException(f"File size exceeds {max_mb}MB limit")
+        # Reject oversized files without touching the file contents
+        max_size, size_error = IMAGE_SIZE_LIMIT if file_type == "image" else DOCUMENT_SIZE_LIMIT
+        if file.size is not None and file.size > max_size:
+            # Size recorded by Starlette while parsing the multipart body
+            raise FileUploadException(size_error)
         
         # Check file type
         if file_type == "image":
-            allowed_types = settings.allowed_image_types_list
+            allowed_types = ALLOWED_IMAGE_TYPES
         else:
-            allowed_types = settings.allowed_document_types_list
+            allowed_types = ALLOWED_DOCUMENT_TYPES
         
         if file.content_type not in allowed_types:
             raise FileUploadException(f"File type {file.content_type} not allowed")
@@ -59,7 +86,8 @@ class FileStorageService:
         file: UploadFile,
         subfolder: str = "documents",
         file_type: str = "document",
-        organization_id: Optional[str] = None
+        organization_id: Optional[str] = None,
+        filename: Optional[str] = None
     ) -> str:
         """
         Save uploaded file to storage
@@ -69,6 +97,7 @@ class FileStorageService:
             subfolder: Subfolder to save file in
             file_type: Type of file (image or document)
             organization_id: Optional organization ID to prefix filename
+            filename: Optional name to store under instead of file.filename
         
         Returns:
             File URL/path
@@ -81,17 +110,30 @@ class FileStorageService:
             FileStorageService.validate_file(file, file_type)
             
             # Sanitize filename with organization_id prefix
-            safe_filename = sanitize_filename(file.filename, prefix=organization_id)
+            safe_filename = sanitize_filename(filename or file.filename, prefix=organization_id)
             
             # Create full path
-            upload_dir = Path(settings.UPLOAD_DIR) / subfolder
+            upload_dir = UPLOAD_SUBFOLDERS.get(subfolder)
+            if upload_dir is None:
+                raise FileUploadException(f"Unknown upload folder '{subfolder}'")
             upload_dir.mkdir(parents=True, exist_ok=True)
             
             file_path = upload_dir / safe_filename
             
-            # Save file
-            with open(file_path, "wb") as buffer:
-                shutil.copyfileobj(file.file, buffer)
+            # Stream file to disk, aborting as soon as the size limit is exceeded
+            max_size, size_error = IMAGE_SIZE_LIMIT if file_type == "image" else DOCUMENT_SIZE_LIMIT
+            written = 0
+            try:
+                async with aiofiles.open(file_path, "wb") as buffer:
+                    while chunk := await file.read(CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > max_size:
+                            raise FileUploadException(size_error)
+                        await buffer.write(chunk)
+            except Exception:
+                # Don't leave partially written files behind
+                file_path.unlink(missing_ok=True)
+                raise
             
             # Return relative URL
             return f"/uploads/{subfolder}/{safe_filename}"
@@ -113,7 +155,11 @@ class FileStorageService:
         try:
             # Extract path from URL
             if file_url.startswith("/uploads/"):
-                file_path = Path(settings.UPLOAD_DIR) / file_url.replace("/uploads/", "")
+                subfolder, _, filename = file_url[len("/uploads/"):].rpartition("/")
+                upload_dir = UPLOAD_SUBFOLDERS.get(subfolder)
+                if upload_dir is None:
+                    return False
+                file_path = upload_dir / filename
                 
                 if file_path.exists():
                     file_path.unlink()
@@ -125,11 +171,21 @@ class FileStorageService:
             return False
     
     @staticmethod
-    async def save_logo(file: UploadFile, organization_id: Optional[str] = None) -> str:
+    async def save_logo(
+        file: UploadFile,
+        organization_id: Optional[str] = None
+    ) -> str:
         """Save laboratory logo"""
         return await FileStorageService.save_file(file, "logos", "image", organization_id)
     
     @staticmethod
-    async def save_document(file: UploadFile, doc_type: str = "general", organization_id: Optional[str] = None) -> str:
+    async def save_document(
+        file: UploadFile,
+        doc_type: str = "general",
+        organization_id: Optional[str] = None,
+        filename: Optional[str] = None
+    ) -> str:
         """Save document file"""
-        return await FileStorageService.save_file(file, f"documents/{doc_type}", "document", organization_id)
+        return await FileStorageService.save_file(
+            file, f"documents/{doc_type}", "document", organization_id, filename
+        )
@@ -68,7 +68,7 @@ class RegisteredOffice(Base):
     __tablename__ = "registered_offices"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     same_as_lab_address = Column(Boolean, default=False)
     address = Column(Text)
@@ -90,7 +90,7 @@ class TopManagement(Base):
     __tablename__ = "top_management"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     name = Column(String(255), nullable=False)
     designation = Column(String(255), nullable=False)
@@ -107,7 +107,7 @@ class ParentOrganization(Base):
     __tablename__ = "parent_organizations"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     same_as_laboratory = Column(Boolean, default=False)
     name = Column(String(255))
@@ -126,7 +126,7 @@ class BankDetails(Base):
     __tablename__ = "bank_details"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     account_holder_name = Column(String(255))
     account_number = Column(String(50))
@@ -143,7 +143,7 @@ class WorkingSchedule(Base):
     __tablename__ = "working_schedules"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     working_days = Column(JSONB)  # ["Mon", "Tue", "Wed", ...]
     organization_type = Column(String(100))
@@ -161,7 +161,7 @@ class ShiftTiming(Base):
     __tablename__ = "shift_timings"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     shift_from = Column(Time, nullable=False)
     shift_to = Column(Time, nullable=False)
@@ -175,7 +175,7 @@ class ComplianceDocument(Base):
     __tablename__ = "compliance_documents"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     document_type = Column(String(100))
     document_type_other = Column(String(255))
@@ -190,7 +190,7 @@ class PolicyDocuments(Base):
     __tablename__ = "policy_documents"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     impartiality_document_url = Column(String(500))
     terms_conditions_document_url = Column(String(500))
@@ -205,7 +205,7 @@ class InfrastructureDetails(Base):
     __tablename__ = "infrastructure_details"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     adequacy_sanctioned_load = Column(Text)
     availability_uninterrupted_power = Column(Boolean, default=False)
@@ -220,7 +220,7 @@ class AccreditationDocument(Base):
     __tablename__ = "accreditation_documents"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     certification_type = Column(String(100))
     certification_type_other = Column(String(255))
@@ -236,7 +236,7 @@ class OtherLabDetails(Base):
     __tablename__ = "other_lab_details"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     other_details = Column(Text)
     other_details_document_url = Column(String(500))
@@ -253,7 +253,7 @@ class QualityManual(Base):
     __tablename__ = "quality_manuals"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     title = Column(String(255))
     issue_number = Column(String(50))
@@ -269,7 +269,7 @@ class SOP(Base):
     __tablename__ = "sops"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     title = Column(String(255))
     number = Column(String(50))
@@ -286,7 +286,7 @@ class QualityFormat(Base):
     __tablename__ = "quality_formats"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     title = Column(String(255))
     number = Column(String(50))
@@ -303,7 +303,7 @@ class QualityProcedure(Base):
     __tablename__ = "quality_procedures"
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False)
+    organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     title = Column(String(255))
     number = Column(String(50))
@@ -2,69 +2,118 @@
 Organization API Routes
 FastAPI endpoints for organization management
 """
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from functools import lru_cache
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Tuple
 from uuid import UUID
 
 from app.core.database import get_db
 from app.modules.organization import schemas, services
 
-router = APIRouter()
-
-
-def serialize_organization(org):
-    """Helper function to serialize organization without nested relationships"""
-    return {
-        "id": org.id,
-        "lab_name": org.lab_name,
-        "lab_address": org.lab_address,
-        "lab_country": org.lab_country,
-        "lab_state": org.lab_state,
-        "lab_district": org.lab_district,
-        "lab_city": org.lab_city,
-        "lab_pin_code": org.lab_pin_code,
-        "lab_logo_url": org.lab_logo_url,
-        "status": org.status,
-        "created_at": org.created_at,
-        "updated_at": org.updated_at
-    }
-
-
-@router.post("/", status_code=status.HTTP_201_CREATED)
-async def create_organization(
+# Handlers are plain def: FastAPI runs them in its threadpool, so the blocking
+# sync Session calls never stall the event loop
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Documents the summary dict returned by the service without validating it at runtime
+SUMMARY_RESPONSES = {200: {"model": schemas.OrganizationSummaryResponse}}
+
+
+@lru_cache(maxsize=None)
+def response_fields(response_cls) -> Tuple[str, ...]:
+    """Helper function to get (once per class) the field names of a response model"""
+    return tuple(response_cls.model_fields)
+
+
+def construct_response(response_cls, obj):
+    """
+    Helper function to build a response model from an ORM instance without validation
+    Every field is supplied and _fields_set is passed, so Pydantic resolves no defaults
+    """
+    if obj is None:
+        return None
+    fields = response_fields(response_cls)
+    return response_cls.model_construct(
+        _fields_set=set(fields),
+        **{key: getattr(obj, key) for key in fields}
+    )
+
+
+def build_organization_response(org) -> schemas.OrganizationResponse:
+    """
+    Build the full organization response from trusted DB data
+    Uses model_construct so loaded rows are not re-validated by Pydantic
+    """
+    return schemas.OrganizationResponse.model_construct(
+        _fields_set=set(response_fields(schemas.OrganizationResponse)),
+        **services.summarize_organization(org),
+        registered_office=construct_response(schemas.RegisteredOfficeResponse, org.registered_office),
+        top_management=[construct_response(schemas.TopManagementResponse, m) for m in org.top_management],
+        parent_organization=construct_response(schemas.ParentOrganizationResponse, org.parent_organization),
+        bank_details=construct_response(schemas.BankDetailsResponse, org.bank_details),
+        working_schedule=construct_response(schemas.WorkingScheduleResponse, org.working_schedule),
+        shift_timings=[construct_response(schemas.ShiftTimingResponse, s) for s in org.shift_timings],
+        compliance_documents=[
+            construct_response(schemas.ComplianceDocumentResponse, d) for d in org.compliance_documents
+        ],
+        policy_documents=construct_response(schemas.PolicyDocumentsResponse, org.policy_documents),
+        infrastructure=construct_response(schemas.InfrastructureResponse, org.infrastructure),
+        accreditation_documents=[
+            construct_response(schemas.AccreditationDocumentResponse, d) for d in org.accreditation_documents
+        ],
+        other_details=construct_response(schemas.OtherDetailsResponse, org.other_details),
+        quality_manual=construct_response(schemas.QualityManualResponse, org.quality_manual),
+        sops=[construct_response(schemas.SOPResponse, s) for s in org.sops],
+        quality_formats=[construct_response(schemas.QualityFormatResponse, f) for f in org.quality_formats],
+        quality_procedures=[
+            construct_response(schemas.QualityProcedureResponse, p) for p in org.quality_procedures
+        ]
+    )
+
+
+@router.post(
+    "/",
+    status_code=status.HTTP_201_CREATED,
+    responses={status.HTTP_201_CREATED: {"model": schemas.OrganizationSummaryResponse}}
+)
+def create_organization(
     org_data: schemas.OrganizationCreate,
     db: Session = Depends(get_db)
 ):
     """Create a new organization"""
     organization = services.OrganizationService.create_organization(db, org_data)
     # Return simplified response to avoid lazy-loading issues with empty relationships
-    return serialize_organization(organization)
+    return services.summarize_organization(organization)
 
 
-@router.get("/{organization_id}", response_model=schemas.OrganizationResponse)
-async def get_organization(
+@router.get("/{organization_id}", responses={200: {"model": schemas.OrganizationResponse}})
+def get_organization(
     organization_id: UUID,
     db: Session = Depends(get_db)
 ):
     """Get organization by ID"""
-    organization = services.OrganizationService.get_organization(db, organization_id)
-    return organization
+    organization = services.OrganizationService.get_organization(
+        db, organization_id, relationships=services.CHILD_RELATIONSHIPS
+    )
+    # Built from trusted DB data, so it is dumped directly instead of re-validated as a response_model
+    return ORJSONResponse(build_organization_response(organization).model_dump())
 
 
-@router.get("/", response_model=List[schemas.OrganizationResponse])
-async def list_organizations(
+@router.get("/", responses={200: {"model": List[schemas.OrganizationSummaryResponse]}})
+def list_organizations(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """List all organizations"""
+    # Rows only carry summary columns, so relationships are never loaded
     organizations = services.OrganizationService.get_organizations(db, skip, limit)
-    return organizations
+    return ORJSONResponse([dict(row) for row in organizations])
 
 
 @router.delete("/{organization_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_organization(
+def delete_organization(
     organization_id: UUID,
     db: Session = Depends(get_db)
 ):
@@ -74,176 +123,105 @@ async def delete_organization(
 
 
 # ============================================================================
-# Step-wise Update Endpoints
+# Partial Update Endpoint
 # ============================================================================
 
-@router.put("/{organization_id}/laboratory-details")
-async def update_laboratory_details(
+@router.patch("/{organization_id}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+def update_organization_step(
     organization_id: UUID,
-    data: schemas.LaboratoryDetailsUpdate,
+    data: schemas.OrganizationStepUpdate,
     db: Session = Depends(get_db)
 ):
-    """Update laboratory details (Step 1)"""
-    organization = services.OrganizationService.update_laboratory_details(db, organization_id, data)
-    return serialize_organization(organization)
+    """
+    Update any single step of the organization wizard
+    The body's "step" field selects the step (e.g. "laboratory_details", "quality_formats")
+    """
+    services.OrganizationService.update_step(db, organization_id, data)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.put("/{organization_id}/registered-office")
-async def update_registered_office(
-    organization_id: UUID,
-    data: schemas.RegisteredOfficeUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update registered office and top management (Step 2)"""
-    organization = services.OrganizationService.update_registered_office(db, organization_id, data)
-    
-    # Return simplified response without nested relationships
-    return {
-        "id": organization.id,
-        "lab_name": organization.lab_name,
-        "lab_address": organization.lab_address,
-        "lab_country": organization.lab_country,
-        "lab_state": organization.lab_state,
-        "lab_district": organization.lab_district,
-        "lab_city": organization.lab_city,
-        "lab_pin_code": organization.lab_pin_code,
-        "lab_logo_url": organization.lab_logo_url,
-        "status": organization.status,
-        "created_at": organization.created_at,
-        "updated_at": organization.updated_at
-    }
-
-
-@router.put("/{organization_id}/parent-organization")
-async def update_parent_organization(
+@router.put("/{organization_id}/steps", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+def bulk_update_organization(
     organization_id: UUID,
-    data: schemas.ParentOrganizationUpdate,
+    data: schemas.OrganizationFullUpdate,
     db: Session = Depends(get_db)
 ):
-    """Update parent organization (Step 3)"""
-    organization = services.OrganizationService.update_parent_organization(db, organization_id, data)
-    return serialize_organization(organization)
+    """
+    Save several wizard steps at once with a single commit
+    The body's "steps" list holds the same tagged payloads PATCH accepts
+    """
+    services.OrganizationService.bulk_update(db, organization_id, data)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
 
-@router.put("/{organization_id}/bank-details")
-async def update_bank_details(
-    organization_id: UUID,
-    data: schemas.BankDetailsUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update bank details (Step 3)"""
-    organization = services.OrganizationService.update_bank_details(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/working-schedule")
-async def update_working_schedule(
-    organization_id: UUID,
-    data: schemas.WorkingScheduleUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update working schedule (Step 4)"""
-    organization = services.OrganizationService.update_working_schedule(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/compliance-documents")
-async def update_compliance_documents(
-    organization_id: UUID,
-    data: schemas.ComplianceDocumentsUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update compliance documents (Step 5)"""
-    print(f"DEBUG: Received compliance documents data: {data.model_dump()}")
-    organization = services.OrganizationService.update_compliance_documents(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/policy-documents")
-async def update_policy_documents(
-    organization_id: UUID,
-    data: schemas.PolicyDocumentsUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update policy documents (Step 6)"""
-    organization = services.OrganizationService.update_policy_documents(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/infrastructure")
-async def update_infrastructure(
-    organization_id: UUID,
-    data: schemas.InfrastructureUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update infrastructure details (Step 7)"""
-    organization = services.OrganizationService.update_infrastructure(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/accreditation")
-async def update_accreditation_documents(
-    organization_id: UUID,
-    data: schemas.AccreditationUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update accreditation documents (Step 8)"""
-    organization = services.OrganizationService.update_accreditation_documents(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/other-details")
-async def update_other_lab_details(
-    organization_id: UUID,
-    data: schemas.OtherLabDetailsUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update other lab details (Step 8)"""
-    organization = services.OrganizationService.update_other_lab_details(db, organization_id, data)
-    return serialize_organization(organization)
-
-
-@router.put("/{organization_id}/quality-manual")
-async def update_quality_manual(
-    organization_id: UUID,
-    data: schemas.QualityManualUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update quality manual and SOPs (Step 9)"""
-    organization = services.OrganizationService.update_quality_manual(db, organization_id, data)
-    return serialize_organization(organization)
-
+# ============================================================================
+# Step-wise Update Endpoints
+# Kept for existing clients; each forwards to the same dispatcher as PATCH.
+# Like PATCH they answer 204 No Content: the wizard keeps its own form state,
+# and clients that need the saved organization call GET /{organization_id}
+# ============================================================================
 
-@router.put("/{organization_id}/quality-formats")
-async def update_quality_formats(
-    organization_id: UUID,
-    data: schemas.QualityFormatsUpdate,
-    db: Session = Depends(get_db)
-):
-    """Update quality formats and procedures (Step 10)"""
-    organization = services.OrganizationService.update_quality_formats(db, organization_id, data)
-    return serialize_organization(organization)
+# (path, route name, body schema, description) for each wizard step
+STEP_ROUTES = (
+    ("laboratory-details", "update_laboratory_details", schemas.LaboratoryDetailsUpdate, "Update laboratory details (Step 1)"),
+    ("registered-office", "update_registered_office", schemas.RegisteredOfficeUpdate, "Update registered office and top management (Step 2)"),
+    ("parent-organization", "update_parent_organization", schemas.ParentOrganizationUpdate, "Update parent organization (Step 3)"),
+    ("bank-details", "update_bank_details", schemas.BankDetailsUpdate, "Update bank details (Step 3)"),
+    ("working-schedule", "update_working_schedule", schemas.WorkingScheduleUpdate, "Update working schedule (Step 4)"),
+    ("compliance-documents", "update_compliance_documents", schemas.ComplianceDocumentsUpdate, "Update compliance documents (Step 5)"),
+    ("policy-documents", "update_policy_documents", schemas.PolicyDocumentsUpdate, "Update policy documents (Step 6)"),
+    ("infrastructure", "update_infrastructure", schemas.InfrastructureUpdate, "Update infrastructure details (Step 7)"),
+    ("accreditation", "update_accreditation_documents", schemas.AccreditationUpdate, "Update accreditation documents (Step 8)"),
+    ("other-details", "update_other_lab_details", schemas.OtherLabDetailsUpdate, "Update other lab details (Step 8)"),
+    ("quality-manual", "update_quality_manual", schemas.QualityManualUpdate, "Update quality manual and SOPs (Step 9)"),
+    ("quality-formats", "update_quality_formats", schemas.QualityFormatsUpdate, "Update quality formats and procedures (Step 10)"),
+)
+
+
+def make_step_handler(schema):
+    """Build the PUT handler for one wizard step; the service dispatches on the body's step tag"""
+    def update_step(
+        organization_id: UUID,
+        data: schema,
+        db: Session = Depends(get_db)
+    ):
+        services.OrganizationService.update_step(db, organization_id, data)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    return update_step
+
+
+for path, name, schema, description in STEP_ROUTES:
+    router.add_api_route(
+        f"/{{organization_id}}/{path}",
+        make_step_handler(schema),
+        methods=["PUT"],
+        name=name,
+        description=description,
+        status_code=status.HTTP_204_NO_CONTENT,
+        response_class=Response
+    )
 
 
 # ============================================================================
 # Validation & Submission
 # ============================================================================
 
-@router.get("/{organization_id}/checklist", response_model=schemas.ChecklistResponse)
-async def get_checklist(
+@router.get("/{organization_id}/checklist", responses={200: {"model": schemas.ChecklistResponse}})
+def get_checklist(
     organization_id: UUID,
     db: Session = Depends(get_db)
 ):
     """Get validation checklist for organization"""
     checklist = services.OrganizationService.get_checklist(db, organization_id)
-    return checklist
+    # Already validated on construction; unset (empty) missing_fields are left out of the payload
+    return ORJSONResponse(checklist.model_dump(mode="json", exclude_unset=True))
 
 
-@router.post("/{organization_id}/submit")
-async def submit_organization(
+@router.post("/{organization_id}/submit", responses=SUMMARY_RESPONSES)
+def submit_organization(
     organization_id: UUID,
     db: Session = Depends(get_db)
 ):
     """Submit organization for approval"""
     organization = services.OrganizationService.submit_organization(db, organization_id)
-    return serialize_organization(organization)
+    return services.summarize_organization(organization)
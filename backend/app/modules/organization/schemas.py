@@ -2,8 +2,8 @@
 Pydantic Schemas for Organization Module
 Request/Response models for API validation
 """
-from pydantic import BaseModel, Field, validator, field_validator
-from typing import Optional, List, Union, Any
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator, model_validator
+from typing import Annotated, Optional, List, Tuple, Union, Any, Literal
 from datetime import date, time, datetime
 from uuid import UUID
 
@@ -16,17 +16,29 @@ from app.utils.validators import (
 )
 
 
+# ============================================================================
+# Shared Field Types
+# ============================================================================
+
+Name = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+Address = Annotated[str, StringConstraints(min_length=1)]
+Region = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+PinCode = Annotated[str, StringConstraints(min_length=6, max_length=10)]
+Mobile = Annotated[str, StringConstraints(min_length=10, max_length=20)]
+Phone = Annotated[str, StringConstraints(max_length=20)]
+
+
 # ============================================================================
 # Base Schemas
 # ============================================================================
 
 class TopManagementBase(BaseModel):
     """Base schema for top management"""
-    name: str = Field(..., min_length=1, max_length=255)
-    designation: str = Field(..., min_length=1, max_length=255)
-    mobile: str = Field(..., min_length=10, max_length=20)
-    telephone: Optional[str] = Field(None, max_length=20)
-    fax: Optional[str] = Field(None, max_length=20)
+    name: Name
+    designation: Name
+    mobile: Mobile
+    telephone: Optional[Phone] = None
+    fax: Optional[Phone] = None
     order_index: int = 0
 
 
@@ -39,14 +51,13 @@ class TopManagementResponse(TopManagementBase):
     """Schema for top management response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ShiftTimingBase(BaseModel):
     """Base schema for shift timing"""
-    shift_from: str  # Will be converted to time
-    shift_to: str    # Will be converted to time
+    shift_from: time  # Parsed from "HH:MM" / "HH:MM:SS"
+    shift_to: time
     order_index: int = 0
 
 
@@ -59,8 +70,7 @@ class ShiftTimingResponse(ShiftTimingBase):
     """Schema for shift timing response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ComplianceDocumentBase(BaseModel):
@@ -80,8 +90,7 @@ class ComplianceDocumentResponse(ComplianceDocumentBase):
     """Schema for compliance document response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class AccreditationDocumentBase(BaseModel):
@@ -102,8 +111,7 @@ class AccreditationDocumentResponse(AccreditationDocumentBase):
     """Schema for accreditation document response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class SOPBase(BaseModel):
@@ -125,8 +133,7 @@ class SOPResponse(SOPBase):
     """Schema for SOP response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QualityFormatBase(BaseModel):
@@ -148,8 +155,7 @@ class QualityFormatResponse(QualityFormatBase):
     """Schema for quality format response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QualityProcedureBase(BaseModel):
@@ -172,8 +178,7 @@ class QualityProcedureResponse(QualityProcedureBase):
     """Schema for quality procedure response"""
     id: UUID
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============================================================================
@@ -182,20 +187,22 @@ class QualityProcedureResponse(QualityProcedureBase):
 
 class LaboratoryDetailsUpdate(BaseModel):
     """Schema for updating laboratory details (Step 1)"""
-    lab_name: str = Field(..., min_length=1, max_length=255)
-    lab_address: str = Field(..., min_length=1)
+    step: Literal["laboratory_details"] = Field("laboratory_details", exclude=True)
+    lab_name: Name
+    lab_address: Address
     lab_country: str = "India"
-    lab_state: str = Field(..., min_length=1, max_length=100)
-    lab_district: str = Field(..., min_length=1, max_length=100)
-    lab_city: str = Field(..., min_length=1, max_length=100)
-    lab_pin_code: str = Field(..., min_length=6, max_length=10)
+    lab_state: Region
+    lab_district: Region
+    lab_city: Region
+    lab_pin_code: PinCode
     lab_logo_url: Optional[str] = None
     lab_proof_of_address: str
     lab_proof_of_address_other: Optional[str] = None
     lab_document_id: Optional[str] = None
     lab_address_proof_url: Optional[str] = None
     
-    @validator('lab_pin_code')
+    @field_validator('lab_pin_code')
+    @classmethod
     def validate_pin(cls, v):
         if not validate_pin_code(v):
             raise ValueError('Invalid PIN code format')
@@ -208,6 +215,7 @@ class LaboratoryDetailsUpdate(BaseModel):
 
 class RegisteredOfficeUpdate(BaseModel):
     """Schema for updating registered office (Step 2)"""
+    step: Literal["registered_office"] = Field("registered_office", exclude=True)
     same_as_lab_address: bool = False
     address: Optional[str] = None
     country: str = "India"
@@ -221,7 +229,8 @@ class RegisteredOfficeUpdate(BaseModel):
     top_management_document_url: Optional[str] = None
     top_management: List[TopManagementCreate] = []
     
-    @validator('mobile')
+    @field_validator('mobile')
+    @classmethod
     def validate_mobile(cls, v):
         if v and not validate_mobile_number(v):
             raise ValueError('Invalid mobile number format')
@@ -234,6 +243,7 @@ class RegisteredOfficeUpdate(BaseModel):
 
 class ParentOrganizationUpdate(BaseModel):
     """Schema for updating parent organization (Step 3)"""
+    step: Literal["parent_organization"] = Field("parent_organization", exclude=True)
     same_as_laboratory: bool = False
     name: Optional[str] = None
     address: Optional[str] = None
@@ -246,6 +256,7 @@ class ParentOrganizationUpdate(BaseModel):
 
 class BankDetailsUpdate(BaseModel):
     """Schema for updating bank details (Step 3)"""
+    step: Literal["bank_details"] = Field("bank_details", exclude=True)
     account_holder_name: Optional[str] = None
     account_number: Optional[str] = None
     ifsc_code: Optional[str] = None
@@ -254,13 +265,15 @@ class BankDetailsUpdate(BaseModel):
     cancelled_cheque_url: Optional[str] = None
     
     # Validators temporarily disabled for testing
-    # @validator('ifsc_code')
+    # @field_validator('ifsc_code')
+    # @classmethod
     # def validate_ifsc(cls, v):
     #     if v and v.strip() and not validate_ifsc_code(v):
     #         raise ValueError('Invalid IFSC code format')
     #     return v
     
-    # @validator('gst_number')
+    # @field_validator('gst_number')
+    # @classmethod
     # def validate_gst(cls, v):
     #     if v and v.strip() and not validate_gst_number(v):
     #         raise ValueError('Invalid GST number format')
@@ -273,6 +286,7 @@ class BankDetailsUpdate(BaseModel):
 
 class WorkingScheduleUpdate(BaseModel):
     """Schema for updating working schedule (Step 4)"""
+    step: Literal["working_schedule"] = Field("working_schedule", exclude=True)
     working_days: List[str] = []
     organization_type: str
     organization_type_other: Optional[str] = None
@@ -289,6 +303,7 @@ class WorkingScheduleUpdate(BaseModel):
 
 class ComplianceDocumentsUpdate(BaseModel):
     """Schema for updating compliance documents (Step 5)"""
+    step: Literal["compliance_documents"] = Field("compliance_documents", exclude=True)
     compliance_documents: List[ComplianceDocumentCreate] = []
 
 
@@ -298,6 +313,7 @@ class ComplianceDocumentsUpdate(BaseModel):
 
 class PolicyDocumentsUpdate(BaseModel):
     """Schema for updating policy documents (Step 6)"""
+    step: Literal["policy_documents"] = Field("policy_documents", exclude=True)
     impartiality_document_url: Optional[str] = None
     terms_conditions_document_url: Optional[str] = None
     code_of_ethics_document_url: Optional[str] = None
@@ -310,6 +326,7 @@ class PolicyDocumentsUpdate(BaseModel):
 
 class InfrastructureUpdate(BaseModel):
     """Schema for updating infrastructure (Step 7)"""
+    step: Literal["infrastructure"] = Field("infrastructure", exclude=True)
     adequacy_sanctioned_load: Optional[str] = None
     availability_uninterrupted_power: bool = False
     stability_of_supply: bool = False
@@ -322,11 +339,13 @@ class InfrastructureUpdate(BaseModel):
 
 class AccreditationUpdate(BaseModel):
     """Schema for updating accreditation (Step 8)"""
+    step: Literal["accreditation"] = Field("accreditation", exclude=True)
     accreditation_documents: List[AccreditationDocumentCreate] = []
 
 
 class OtherLabDetailsUpdate(BaseModel):
     """Schema for updating other lab details (Step 8)"""
+    step: Literal["other_details"] = Field("other_details", exclude=True)
     other_details: Optional[str] = None
     other_details_document_url: Optional[str] = None
     layout_lab_premises_url: Optional[str] = None
@@ -334,13 +353,13 @@ class OtherLabDetailsUpdate(BaseModel):
     gps_latitude: Optional[str] = None
     gps_longitude: Optional[str] = None
     
-    @validator('gps_latitude', 'gps_longitude')
-    def validate_gps(cls, v, values):
-        lat = values.get('gps_latitude')
-        lon = v if 'gps_longitude' in values else values.get('gps_longitude')
+    @model_validator(mode='after')
+    def validate_gps(self):
+        lat = self.gps_latitude
+        lon = self.gps_longitude
         if lat and lon and not validate_coordinates(lat, lon):
             raise ValueError('Invalid GPS coordinates')
-        return v
+        return self
 
 
 # ============================================================================
@@ -349,6 +368,7 @@ class OtherLabDetailsUpdate(BaseModel):
 
 class QualityManualUpdate(BaseModel):
     """Schema for updating quality manual (Step 9)"""
+    step: Literal["quality_manual"] = Field("quality_manual", exclude=True)
     title: Optional[str] = None
     issue_number: Optional[str] = None
     issue_date: Optional[date] = None
@@ -363,26 +383,168 @@ class QualityManualUpdate(BaseModel):
 
 class QualityFormatsUpdate(BaseModel):
     """Schema for updating quality formats (Step 10)"""
+    step: Literal["quality_formats"] = Field("quality_formats", exclude=True)
     quality_formats: List[QualityFormatCreate] = []
     quality_procedures: List[QualityProcedureCreate] = []
 
 
+# ============================================================================
+# Partial Update (any single step, selected by its "step" tag)
+# ============================================================================
+
+OrganizationStepUpdate = Annotated[
+    Union[
+        LaboratoryDetailsUpdate,
+        RegisteredOfficeUpdate,
+        ParentOrganizationUpdate,
+        BankDetailsUpdate,
+        WorkingScheduleUpdate,
+        ComplianceDocumentsUpdate,
+        PolicyDocumentsUpdate,
+        InfrastructureUpdate,
+        AccreditationUpdate,
+        OtherLabDetailsUpdate,
+        QualityManualUpdate,
+        QualityFormatsUpdate
+    ],
+    Field(discriminator="step")
+]
+
+
+class OrganizationFullUpdate(BaseModel):
+    """Several wizard steps saved together in one transaction, applied in list order"""
+    steps: List[OrganizationStepUpdate] = Field(..., min_length=1)
+
+
 # ============================================================================
 # Complete Organization Schemas
 # ============================================================================
 
 class OrganizationCreate(BaseModel):
     """Schema for creating a new organization"""
-    lab_name: str = Field(..., min_length=1, max_length=255)
-    lab_address: str = Field(..., min_length=1)
-    lab_state: str = Field(..., min_length=1, max_length=100)
-    lab_district: str = Field(..., min_length=1, max_length=100)
-    lab_city: str = Field(..., min_length=1, max_length=100)
-    lab_pin_code: str = Field(..., min_length=6, max_length=10)
+    lab_name: Name
+    lab_address: Address
+    lab_state: Region
+    lab_district: Region
+    lab_city: Region
+    lab_pin_code: PinCode
 
 
-class OrganizationResponse(BaseModel):
-    """Schema for organization response"""
+# Response config for trusted DB data: read ORM attributes, immutable, drop unknown keys
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, frozen=True, extra='ignore')
+
+
+class RegisteredOfficeResponse(BaseModel):
+    """Schema for registered office response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    same_as_lab_address: Optional[bool] = None
+    address: Optional[str] = None
+    country: Optional[str] = None
+    state: Optional[str] = None
+    district: Optional[str] = None
+    city: Optional[str] = None
+    pin_code: Optional[str] = None
+    mobile: Optional[str] = None
+    telephone: Optional[str] = None
+    fax: Optional[str] = None
+    top_management_document_url: Optional[str] = None
+
+
+class ParentOrganizationResponse(BaseModel):
+    """Schema for parent organization response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    same_as_laboratory: Optional[bool] = None
+    name: Optional[str] = None
+    address: Optional[str] = None
+    country: Optional[str] = None
+    state: Optional[str] = None
+    district: Optional[str] = None
+    city: Optional[str] = None
+    pin_code: Optional[str] = None
+
+
+class BankDetailsResponse(BaseModel):
+    """Schema for bank details response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    account_holder_name: Optional[str] = None
+    account_number: Optional[str] = None
+    ifsc_code: Optional[str] = None
+    branch_name: Optional[str] = None
+    gst_number: Optional[str] = None
+    cancelled_cheque_url: Optional[str] = None
+
+
+class WorkingScheduleResponse(BaseModel):
+    """Schema for working schedule response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    working_days: Optional[List[str]] = None
+    organization_type: Optional[str] = None
+    organization_type_other: Optional[str] = None
+    proof_of_legal_identity: Optional[str] = None
+    proof_of_legal_identity_other: Optional[str] = None
+    legal_identity_document_id: Optional[str] = None
+    legal_identity_document_url: Optional[str] = None
+
+
+class PolicyDocumentsResponse(BaseModel):
+    """Schema for policy documents response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    impartiality_document_url: Optional[str] = None
+    terms_conditions_document_url: Optional[str] = None
+    code_of_ethics_document_url: Optional[str] = None
+    testing_charges_policy_document_url: Optional[str] = None
+
+
+class InfrastructureResponse(BaseModel):
+    """Schema for infrastructure response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    adequacy_sanctioned_load: Optional[str] = None
+    availability_uninterrupted_power: Optional[bool] = None
+    stability_of_supply: Optional[bool] = None
+    water_source: Optional[str] = None
+
+
+class OtherDetailsResponse(BaseModel):
+    """Schema for other lab details response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    other_details: Optional[str] = None
+    other_details_document_url: Optional[str] = None
+    layout_lab_premises_url: Optional[str] = None
+    organization_chart_url: Optional[str] = None
+    gps_latitude: Optional[float] = None
+    gps_longitude: Optional[float] = None
+
+
+class QualityManualResponse(BaseModel):
+    """Schema for quality manual response"""
+    model_config = RESPONSE_CONFIG
+    
+    id: UUID
+    title: Optional[str] = None
+    issue_number: Optional[str] = None
+    issue_date: Optional[date] = None
+    amendments: Optional[str] = None
+    document_url: Optional[str] = None
+
+
+class OrganizationSummaryResponse(BaseModel):
+    """Schema for organization response without nested relationships"""
+    model_config = RESPONSE_CONFIG
+    
     id: UUID
     lab_name: str
     lab_address: str
@@ -395,26 +557,27 @@ class OrganizationResponse(BaseModel):
     status: str
     created_at: datetime
     updated_at: datetime
+
+
+class OrganizationResponse(OrganizationSummaryResponse):
+    """Schema for organization response"""
     
     # Related data
-    registered_office: Optional[dict] = None
-    top_management: List[TopManagementResponse] = []
-    parent_organization: Optional[dict] = None
-    bank_details: Optional[dict] = None
-    working_schedule: Optional[dict] = None
-    shift_timings: List[ShiftTimingResponse] = []
-    compliance_documents: List[ComplianceDocumentResponse] = []
-    policy_documents: Optional[dict] = None
-    infrastructure: Optional[dict] = None
-    accreditation_documents: List[AccreditationDocumentResponse] = []
-    other_details: Optional[dict] = None
-    quality_manual: Optional[dict] = None
-    sops: List[SOPResponse] = []
-    quality_formats: List[QualityFormatResponse] = []
-    quality_procedures: List[QualityProcedureResponse] = []
-    
-    class Config:
-        from_attributes = True
+    registered_office: Optional[RegisteredOfficeResponse] = None
+    top_management: List[TopManagementResponse] = Field(default_factory=list)
+    parent_organization: Optional[ParentOrganizationResponse] = None
+    bank_details: Optional[BankDetailsResponse] = None
+    working_schedule: Optional[WorkingScheduleResponse] = None
+    shift_timings: List[ShiftTimingResponse] = Field(default_factory=list)
+    compliance_documents: List[ComplianceDocumentResponse] = Field(default_factory=list)
+    policy_documents: Optional[PolicyDocumentsResponse] = None
+    infrastructure: Optional[InfrastructureResponse] = None
+    accreditation_documents: List[AccreditationDocumentResponse] = Field(default_factory=list)
+    other_details: Optional[OtherDetailsResponse] = None
+    quality_manual: Optional[QualityManualResponse] = None
+    sops: List[SOPResponse] = Field(default_factory=list)
+    quality_formats: List[QualityFormatResponse] = Field(default_factory=list)
+    quality_procedures: List[QualityProcedureResponse] = Field(default_factory=list)
 
 
 class ChecklistItem(BaseModel):
@@ -422,8 +585,8 @@ class ChecklistItem(BaseModel):
     step_id: int
     step_name: str
     is_completed: bool
-    required_fields: List[str] = []
-    missing_fields: List[str] = []
+    required_fields: Tuple[str, ...] = ()
+    missing_fields: Tuple[str, ...] = ()
 
 
 class ChecklistResponse(BaseModel):
@@ -432,3 +595,33 @@ class ChecklistResponse(BaseModel):
     overall_completion: float
     is_ready_for_submission: bool
     steps: List[ChecklistItem]
+
+
+# ============================================================================
+# Schema Warm-up
+# ============================================================================
+
+# Build JSON schemas at import so the first request and /docs hit don't pay for it.
+# Validators/serializers are already built eagerly (defer_build defaults to False);
+# schema changes require a server restart either way.
+for _model in (
+    LaboratoryDetailsUpdate,
+    RegisteredOfficeUpdate,
+    ParentOrganizationUpdate,
+    BankDetailsUpdate,
+    WorkingScheduleUpdate,
+    ComplianceDocumentsUpdate,
+    PolicyDocumentsUpdate,
+    InfrastructureUpdate,
+    AccreditationUpdate,
+    OtherLabDetailsUpdate,
+    QualityManualUpdate,
+    QualityFormatsUpdate,
+    OrganizationFullUpdate,
+    OrganizationCreate,
+    OrganizationSummaryResponse,
+    OrganizationResponse,
+    ChecklistResponse,
+):
+    _model.model_json_schema()
+del _model
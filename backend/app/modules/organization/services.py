@@ -2,15 +2,214 @@
 Organization Service Layer
 Business logic for organization operations
 """
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from sqlalchemy import RowMapping, delete, insert, inspect, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import Iterable, Optional, List, Sequence
 from uuid import UUID
-from datetime import datetime, time
 
 from app.modules.organization import models, schemas
 from app.utils.exceptions import NotFoundException, BadRequestException
 
 
+# Relationships loaded up front when the full organization is requested
+CHILD_RELATIONSHIPS = (
+    models.Organization.registered_office,
+    models.Organization.top_management,
+    models.Organization.parent_organization,
+    models.Organization.bank_details,
+    models.Organization.working_schedule,
+    models.Organization.shift_timings,
+    models.Organization.compliance_documents,
+    models.Organization.policy_documents,
+    models.Organization.infrastructure,
+    models.Organization.accreditation_documents,
+    models.Organization.other_details,
+    models.Organization.quality_manual,
+    models.Organization.sops,
+    models.Organization.quality_formats,
+    models.Organization.quality_procedures,
+)
+
+# Relationships read by the checklist
+CHECKLIST_RELATIONSHIPS = (
+    models.Organization.registered_office,
+    models.Organization.top_management,
+    models.Organization.working_schedule,
+    models.Organization.shift_timings,
+    models.Organization.policy_documents,
+    models.Organization.infrastructure,
+    models.Organization.other_details,
+    models.Organization.quality_manual,
+)
+
+# Columns needed for the organization summary used by list endpoints
+SUMMARY_COLUMNS = (
+    models.Organization.id,
+    models.Organization.lab_name,
+    models.Organization.lab_address,
+    models.Organization.lab_country,
+    models.Organization.lab_state,
+    models.Organization.lab_district,
+    models.Organization.lab_city,
+    models.Organization.lab_pin_code,
+    models.Organization.lab_logo_url,
+    models.Organization.status,
+    models.Organization.created_at,
+    models.Organization.updated_at,
+)
+
+
+# Required fields reported per checklist step; shared tuples instead of per-request lists
+LAB_DETAILS_REQUIRED_FIELDS = ("lab_name", "lab_address", "lab_state", "lab_district", "lab_city", "lab_pin_code")
+REGISTERED_OFFICE_REQUIRED_FIELDS = ("registered_office", "top_management")
+WORKING_SCHEDULE_REQUIRED_FIELDS = ("working_schedule", "shift_timings")
+POLICY_DOCUMENTS_REQUIRED_FIELDS = ("policy_documents",)
+INFRASTRUCTURE_REQUIRED_FIELDS = ("infrastructure",)
+OTHER_DETAILS_REQUIRED_FIELDS = ("other_details",)
+QUALITY_MANUAL_REQUIRED_FIELDS = ("quality_manual",)
+
+# Checklist steps: (step id, step name, required fields). Steps 3, 5 and 10 are
+# optional and always complete; a field counts as filled when its value is truthy
+# (non-empty column, existing one-to-one row, non-empty collection)
+CHECKLIST_STEPS = (
+    (1, "Laboratory Details", LAB_DETAILS_REQUIRED_FIELDS),
+    (2, "Registered Office", REGISTERED_OFFICE_REQUIRED_FIELDS),
+    (3, "Parent Organization", ()),
+    (4, "Working Days & Type", WORKING_SCHEDULE_REQUIRED_FIELDS),
+    (5, "Compliance Documents", ()),
+    (6, "Undertakings & Policies", POLICY_DOCUMENTS_REQUIRED_FIELDS),
+    (7, "Power & Water Supply", INFRASTRUCTURE_REQUIRED_FIELDS),
+    (8, "Accreditation & Other", OTHER_DETAILS_REQUIRED_FIELDS),
+    (9, "Quality Manual & SOPs", QUALITY_MANUAL_REQUIRED_FIELDS),
+    (10, "Quality Formats & Procedures", ()),
+)
+CHECKLIST_FIELDS = tuple(dict.fromkeys(
+    field for _, _, required_fields in CHECKLIST_STEPS for field in required_fields
+))
+
+# Registered office / parent organization field -> laboratory column it mirrors
+# when the "same as laboratory" flag is set
+LAB_ADDRESS_FIELDS = {
+    "address": "lab_address",
+    "country": "lab_country",
+    "state": "lab_state",
+    "district": "lab_district",
+    "city": "lab_city",
+    "pin_code": "lab_pin_code",
+}
+LAB_NAME_AND_ADDRESS_FIELDS = {"name": "lab_name", **LAB_ADDRESS_FIELDS}
+
+# Nested child lists excluded when dumping a step payload into its parent row
+TOP_MANAGEMENT_FIELD = frozenset({'top_management'})
+SHIFT_TIMINGS_FIELD = frozenset({'shift_timings'})
+SOPS_FIELD = frozenset({'sops'})
+
+# Attribute names of SUMMARY_COLUMNS
+SUMMARY_KEYS = tuple(column.key for column in SUMMARY_COLUMNS)
+
+
+def summarize_organization(organization: models.Organization) -> dict:
+    """
+    Read the summary columns of an organization into a plain dict (wire format for orjson)
+    
+    Loaded values are read from the instance state directly, skipping the
+    instrumented attribute descriptors; expired ones fall back to getattr.
+    """
+    loaded = inspect(organization).dict
+    return {
+        key: loaded[key] if key in loaded else getattr(organization, key)
+        for key in SUMMARY_KEYS
+    }
+
+
+def eager_load_options(relationships: Sequence) -> list:
+    """
+    Loader options for the given relationships: one-to-ones are joinedload-ed into
+    the organization SELECT, collections are batched with one selectinload query each
+    """
+    return [
+        selectinload(rel) if rel.property.uselist else joinedload(rel)
+        for rel in relationships
+    ]
+
+
+def ordered_rows(items: Sequence) -> List[dict]:
+    """Dump child schemas to row dicts, numbering order_index by list position"""
+    return [{**item.model_dump(), "order_index": idx} for idx, item in enumerate(items)]
+
+
+def sync_children(db: Session, model, organization_id: UUID, rows: List[dict]) -> None:
+    """
+    Make an organization's child rows match `rows` without delete-and-reinsert
+    
+    Existing rows are overwritten position by position, extra incoming rows are
+    inserted and leftover rows are deleted, one statement each.
+    """
+    order_by = model.order_index if hasattr(model, "order_index") else model.id
+    existing_ids = db.execute(
+        select(model.id).where(model.organization_id == organization_id).order_by(order_by)
+    ).scalars().all()
+    
+    to_update = [{**row, "id": row_id} for row_id, row in zip(existing_ids, rows)]
+    to_insert = [{**row, "organization_id": organization_id} for row in rows[len(existing_ids):]]
+    stale_ids = existing_ids[len(rows):]
+    
+    # ORM bulk statements: UPDATE by primary key as one executemany, INSERT as
+    # multi-row VALUES (insertmanyvalues); neither builds mapped instances
+    if to_update:
+        db.execute(update(model), to_update)
+    if to_insert:
+        db.execute(insert(model), to_insert)
+    if stale_ids:
+        db.execute(
+            delete(model)
+            .where(model.id.in_(stale_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+
+def set_fields(data, values: dict) -> List[str]:
+    """Keys of a dumped payload that the client actually sent"""
+    return [key for key in values if key in data.model_fields_set]
+
+
+def save_one_to_one(
+    db: Session,
+    model,
+    organization_id: UUID,
+    values: dict,
+    update_keys: Iterable[str]
+) -> None:
+    """
+    Write an organization's one-to-one child row without loading it
+    
+    An existing row gets `update_keys` in a single UPDATE; when the organization
+    has no row yet, one is inserted from the full `values`.
+    """
+    changes = {key: values[key] for key in update_keys}
+    if changes:
+        exists = db.execute(
+            update(model)
+            .where(model.organization_id == organization_id)
+            .values(**changes)
+            .execution_options(synchronize_session=False)
+        ).rowcount > 0
+    else:
+        exists = db.execute(
+            select(model.id).where(model.organization_id == organization_id).limit(1)
+        ).first() is not None
+    
+    if not exists:
+        db.execute(insert(model).values(organization_id=organization_id, **values))
+
+
+def copy_lab_fields(organization: models.Organization, values: dict, field_map: dict) -> dict:
+    """Overwrite address values with the (already loaded) laboratory columns, in place"""
+    for key, lab_key in field_map.items():
+        values[key] = getattr(organization, lab_key)
+    return values
+
+
 class OrganizationService:
     """Service class for organization operations"""
     
@@ -29,17 +228,24 @@ class OrganizationService:
         organization = models.Organization(**org_data.model_dump())
         db.add(organization)
         db.commit()
-        db.refresh(organization)
+        # No refresh: the INSERT returns the server-side timestamps and the
+        # session keeps everything else loaded across the commit
         return organization
     
     @staticmethod
-    def get_organization(db: Session, organization_id: UUID) -> models.Organization:
+    def get_organization(
+        db: Session,
+        organization_id: UUID,
+        relationships: Sequence = ()
+    ) -> models.Organization:
         """
         Get organization by ID
         
         Args:
             db: Database session
             organization_id: Organization UUID
+            relationships: Relationships to eager-load with the organization
+                (e.g. CHILD_RELATIONSHIPS); others stay lazy
         
         Returns:
             Organization object
@@ -47,9 +253,11 @@ class OrganizationService:
         Raises:
             NotFoundException: If organization not found
         """
-        organization = db.query(models.Organization).filter(
-            models.Organization.id == organization_id
-        ).first()
+        stmt = select(models.Organization).where(models.Organization.id == organization_id)
+        if relationships:
+            stmt = stmt.options(*eager_load_options(relationships))
+        
+        organization = db.execute(stmt).unique().scalar_one_or_none()
         
         if not organization:
             raise NotFoundException(f"Organization with ID {organization_id} not found")
@@ -61,7 +269,7 @@ class OrganizationService:
         db: Session,
         skip: int = 0,
         limit: int = 100
-    ) -> List[models.Organization]:
+    ) -> List[RowMapping]:
         """
         Get list of organizations with pagination
         
@@ -71,9 +279,10 @@ class OrganizationService:
             limit: Maximum number of records to return
         
         Returns:
-            List of organizations
+            List of mappings with the organization summary columns (no ORM instances)
         """
-        return db.query(models.Organization).offset(skip).limit(limit).all()
+        stmt = select(*SUMMARY_COLUMNS).offset(skip).limit(limit)
+        return db.execute(stmt).mappings().all()
     
     @staticmethod
     def delete_organization(db: Session, organization_id: UUID) -> bool:
@@ -86,9 +295,18 @@ class OrganizationService:
         
         Returns:
             True if deleted successfully
+        
+        Raises:
+            NotFoundException: If organization not found
         """
-        organization = OrganizationService.get_organization(db, organization_id)
-        db.delete(organization)
+        # One DELETE; child rows go with it through the ON DELETE CASCADE foreign keys
+        # instead of being loaded and deleted one by one by the ORM cascade
+        result = db.execute(
+            delete(models.Organization).where(models.Organization.id == organization_id)
+        )
+        if result.rowcount == 0:
+            raise NotFoundException(f"Organization with ID {organization_id} not found")
+        
         db.commit()
         return True
     
@@ -100,7 +318,8 @@ class OrganizationService:
     def update_laboratory_details(
         db: Session,
         organization_id: UUID,
-        data: schemas.LaboratoryDetailsUpdate
+        data: schemas.LaboratoryDetailsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update laboratory details (Step 1)"""
         organization = OrganizationService.get_organization(db, organization_id)
@@ -108,8 +327,8 @@ class OrganizationService:
         for key, value in data.model_dump(exclude_unset=True).items():
             setattr(organization, key, value)
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -120,40 +339,25 @@ class OrganizationService:
     def update_registered_office(
         db: Session,
         organization_id: UUID,
-        data: schemas.RegisteredOfficeUpdate
+        data: schemas.RegisteredOfficeUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update registered office and top management (Step 2)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
         # Update or create registered office
-        if organization.registered_office:
-            for key, value in data.model_dump(exclude={'top_management'}, exclude_unset=True).items():
-                setattr(organization.registered_office, key, value)
-        else:
-            office_data = data.model_dump(exclude={'top_management'})
-            registered_office = models.RegisteredOffice(
-                organization_id=organization_id,
-                **office_data
-            )
-            db.add(registered_office)
+        office_data = data.model_dump(exclude=TOP_MANAGEMENT_FIELD)
+        update_keys = set_fields(data, office_data)
+        if data.same_as_lab_address:
+            copy_lab_fields(organization, office_data, LAB_ADDRESS_FIELDS)
+            update_keys.extend(LAB_ADDRESS_FIELDS)
+        save_one_to_one(db, models.RegisteredOffice, organization_id, office_data, update_keys)
         
         # Update top management
-        # Delete existing
-        db.query(models.TopManagement).filter(
-            models.TopManagement.organization_id == organization_id
-        ).delete()
-        
-        # Add new
-        for idx, tm_data in enumerate(data.top_management):
-            top_mgmt = models.TopManagement(
-                organization_id=organization_id,
-                order_index=idx,
-                **tm_data.model_dump(exclude={'order_index'})
-            )
-            db.add(top_mgmt)
+        sync_children(db, models.TopManagement, organization_id, ordered_rows(data.top_management))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -164,46 +368,38 @@ class OrganizationService:
     def update_parent_organization(
         db: Session,
         organization_id: UUID,
-        data: schemas.ParentOrganizationUpdate
+        data: schemas.ParentOrganizationUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update parent organization (Step 3)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        if organization.parent_organization:
-            for key, value in data.model_dump(exclude_unset=True).items():
-                setattr(organization.parent_organization, key, value)
-        else:
-            parent_org = models.ParentOrganization(
-                organization_id=organization_id,
-                **data.model_dump()
-            )
-            db.add(parent_org)
+        parent_data = data.model_dump()
+        update_keys = set_fields(data, parent_data)
+        if data.same_as_laboratory:
+            copy_lab_fields(organization, parent_data, LAB_NAME_AND_ADDRESS_FIELDS)
+            update_keys.extend(LAB_NAME_AND_ADDRESS_FIELDS)
+        save_one_to_one(db, models.ParentOrganization, organization_id, parent_data, update_keys)
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     @staticmethod
     def update_bank_details(
         db: Session,
         organization_id: UUID,
-        data: schemas.BankDetailsUpdate
+        data: schemas.BankDetailsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update bank details (Step 3)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        if organization.bank_details:
-            for key, value in data.model_dump(exclude_unset=True).items():
-                setattr(organization.bank_details, key, value)
-        else:
-            bank_details = models.BankDetails(
-                organization_id=organization_id,
-                **data.model_dump()
-            )
-            db.add(bank_details)
+        values = data.model_dump()
+        save_one_to_one(db, models.BankDetails, organization_id, values, set_fields(data, values))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -214,43 +410,23 @@ class OrganizationService:
     def update_working_schedule(
         db: Session,
         organization_id: UUID,
-        data: schemas.WorkingScheduleUpdate
+        data: schemas.WorkingScheduleUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update working schedule (Step 4)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        # Update working schedule
-        if organization.working_schedule:
-            for key, value in data.model_dump(exclude={'shift_timings'}, exclude_unset=True).items():
-                setattr(organization.working_schedule, key, value)
-        else:
-            schedule_data = data.model_dump(exclude={'shift_timings'})
-            working_schedule = models.WorkingSchedule(
-                organization_id=organization_id,
-                **schedule_data
-            )
-            db.add(working_schedule)
+        # Update or create working schedule
+        schedule_data = data.model_dump(exclude=SHIFT_TIMINGS_FIELD)
+        save_one_to_one(
+            db, models.WorkingSchedule, organization_id, schedule_data, set_fields(data, schedule_data)
+        )
         
         # Update shift timings
-        db.query(models.ShiftTiming).filter(
-            models.ShiftTiming.organization_id == organization_id
-        ).delete()
-        
-        for idx, shift_data in enumerate(data.shift_timings):
-            # Convert string times to time objects
-            shift_dict = shift_data.model_dump()
-            shift_dict['shift_from'] = datetime.strptime(shift_dict['shift_from'], '%H:%M').time()
-            shift_dict['shift_to'] = datetime.strptime(shift_dict['shift_to'], '%H:%M').time()
-            shift_dict['order_index'] = idx
-            
-            shift = models.ShiftTiming(
-                organization_id=organization_id,
-                **shift_dict
-            )
-            db.add(shift)
+        sync_children(db, models.ShiftTiming, organization_id, ordered_rows(data.shift_timings))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -261,26 +437,21 @@ class OrganizationService:
     def update_compliance_documents(
         db: Session,
         organization_id: UUID,
-        data: schemas.ComplianceDocumentsUpdate
+        data: schemas.ComplianceDocumentsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update compliance documents (Step 5)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        # Delete existing
-        db.query(models.ComplianceDocument).filter(
-            models.ComplianceDocument.organization_id == organization_id
-        ).delete()
-        
-        # Add new
-        for doc_data in data.compliance_documents:
-            doc = models.ComplianceDocument(
-                organization_id=organization_id,
-                **doc_data.model_dump()
-            )
-            db.add(doc)
+        sync_children(
+            db,
+            models.ComplianceDocument,
+            organization_id,
+            [doc_data.model_dump() for doc_data in data.compliance_documents]
+        )
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -291,23 +462,17 @@ class OrganizationService:
     def update_policy_documents(
         db: Session,
         organization_id: UUID,
-        data: schemas.PolicyDocumentsUpdate
+        data: schemas.PolicyDocumentsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update policy documents (Step 6)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        if organization.policy_documents:
-            for key, value in data.model_dump(exclude_unset=True).items():
-                setattr(organization.policy_documents, key, value)
-        else:
-            policy_docs = models.PolicyDocuments(
-                organization_id=organization_id,
-                **data.model_dump()
-            )
-            db.add(policy_docs)
+        values = data.model_dump()
+        save_one_to_one(db, models.PolicyDocuments, organization_id, values, set_fields(data, values))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -318,23 +483,17 @@ class OrganizationService:
     def update_infrastructure(
         db: Session,
         organization_id: UUID,
-        data: schemas.InfrastructureUpdate
+        data: schemas.InfrastructureUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update infrastructure details (Step 7)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        if organization.infrastructure:
-            for key, value in data.model_dump(exclude_unset=True).items():
-                setattr(organization.infrastructure, key, value)
-        else:
-            infrastructure = models.InfrastructureDetails(
-                organization_id=organization_id,
-                **data.model_dump()
-            )
-            db.add(infrastructure)
+        values = data.model_dump()
+        save_one_to_one(db, models.InfrastructureDetails, organization_id, values, set_fields(data, values))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -345,33 +504,29 @@ class OrganizationService:
     def update_accreditation_documents(
         db: Session,
         organization_id: UUID,
-        data: schemas.AccreditationUpdate
+        data: schemas.AccreditationUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update accreditation documents (Step 8)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        # Delete existing
-        db.query(models.AccreditationDocument).filter(
-            models.AccreditationDocument.organization_id == organization_id
-        ).delete()
-        
-        # Add new
-        for doc_data in data.accreditation_documents:
-            doc = models.AccreditationDocument(
-                organization_id=organization_id,
-                **doc_data.model_dump()
-            )
-            db.add(doc)
+        sync_children(
+            db,
+            models.AccreditationDocument,
+            organization_id,
+            [doc_data.model_dump() for doc_data in data.accreditation_documents]
+        )
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     @staticmethod
     def update_other_lab_details(
         db: Session,
         organization_id: UUID,
-        data: schemas.OtherLabDetailsUpdate
+        data: schemas.OtherLabDetailsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update other lab details (Step 8)"""
         organization = OrganizationService.get_organization(db, organization_id)
@@ -383,18 +538,10 @@ class OrganizationService:
         if 'gps_longitude' in data_dict and data_dict['gps_longitude']:
             data_dict['gps_longitude'] = float(data_dict['gps_longitude'])
         
-        if organization.other_details:
-            for key, value in data_dict.items():
-                setattr(organization.other_details, key, value)
-        else:
-            other_details = models.OtherLabDetails(
-                organization_id=organization_id,
-                **data_dict
-            )
-            db.add(other_details)
+        save_one_to_one(db, models.OtherLabDetails, organization_id, data_dict, data_dict)
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -405,39 +552,22 @@ class OrganizationService:
     def update_quality_manual(
         db: Session,
         organization_id: UUID,
-        data: schemas.QualityManualUpdate
+        data: schemas.QualityManualUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update quality manual and SOPs (Step 9)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
-        # Update quality manual
-        manual_data = data.model_dump(exclude={'sops'})
-        if organization.quality_manual:
-            for key, value in manual_data.items():
-                if value is not None:
-                    setattr(organization.quality_manual, key, value)
-        else:
-            quality_manual = models.QualityManual(
-                organization_id=organization_id,
-                **manual_data
-            )
-            db.add(quality_manual)
+        # Update quality manual (an existing manual keeps values sent as null)
+        manual_data = data.model_dump(exclude=SOPS_FIELD)
+        update_keys = [key for key, value in manual_data.items() if value is not None]
+        save_one_to_one(db, models.QualityManual, organization_id, manual_data, update_keys)
         
         # Update SOPs
-        db.query(models.SOP).filter(
-            models.SOP.organization_id == organization_id
-        ).delete()
-        
-        for idx, sop_data in enumerate(data.sops):
-            sop = models.SOP(
-                organization_id=organization_id,
-                order_index=idx,
-                **sop_data.model_dump(exclude={'order_index'})
-            )
-            db.add(sop)
+        sync_children(db, models.SOP, organization_id, ordered_rows(data.sops))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
     # ========================================================================
@@ -448,184 +578,138 @@ class OrganizationService:
     def update_quality_formats(
         db: Session,
         organization_id: UUID,
-        data: schemas.QualityFormatsUpdate
+        data: schemas.QualityFormatsUpdate,
+        commit: bool = True
     ) -> models.Organization:
         """Update quality formats and procedures (Step 10)"""
         organization = OrganizationService.get_organization(db, organization_id)
         
         # Update quality formats
-        db.query(models.QualityFormat).filter(
-            models.QualityFormat.organization_id == organization_id
-        ).delete()
-        
-        for idx, format_data in enumerate(data.quality_formats):
-            quality_format = models.QualityFormat(
-                organization_id=organization_id,
-                order_index=idx,
-                **format_data.model_dump(exclude={'order_index'})
-            )
-            db.add(quality_format)
+        sync_children(db, models.QualityFormat, organization_id, ordered_rows(data.quality_formats))
         
         # Update quality procedures
-        db.query(models.QualityProcedure).filter(
-            models.QualityProcedure.organization_id == organization_id
-        ).delete()
-        
-        for idx, proc_data in enumerate(data.quality_procedures):
-            procedure = models.QualityProcedure(
-                organization_id=organization_id,
-                order_index=idx,
-                **proc_data.model_dump(exclude={'order_index'})
-            )
-            db.add(procedure)
+        sync_children(db, models.QualityProcedure, organization_id, ordered_rows(data.quality_procedures))
         
-        db.commit()
-        db.refresh(organization)
+        if commit:
+            db.commit()
         return organization
     
+    # ========================================================================
+    # Partial Update (single endpoint for any step)
+    # ========================================================================
+    
+    @staticmethod
+    def update_step(
+        db: Session,
+        organization_id: UUID,
+        data: schemas.OrganizationStepUpdate
+    ) -> None:
+        """Apply a single step update, dispatched on the payload's step tag"""
+        STEP_UPDATERS[data.step](db, organization_id, data)
+    
+    @staticmethod
+    def bulk_update(
+        db: Session,
+        organization_id: UUID,
+        payload: schemas.OrganizationFullUpdate
+    ) -> None:
+        """
+        Apply several step updates in one transaction
+        
+        Each step is applied without committing and the whole batch is committed
+        once at the end; if any step fails nothing is saved.
+        """
+        for data in payload.steps:
+            STEP_UPDATERS[data.step](db, organization_id, data, commit=False)
+        db.commit()
+    
     # ========================================================================
     # Validation & Submission
     # ========================================================================
     
     @staticmethod
-    def get_checklist(db: Session, organization_id: UUID) -> schemas.ChecklistResponse:
-        """Get validation checklist for organization"""
-        organization = OrganizationService.get_organization(db, organization_id)
+    def get_checklist(
+        db: Session,
+        organization_id: UUID,
+        organization: Optional[models.Organization] = None
+    ) -> schemas.ChecklistResponse:
+        """
+        Get validation checklist for organization
         
+        Args:
+            db: Database session
+            organization_id: Organization UUID
+            organization: Already-loaded organization (ideally with CHECKLIST_RELATIONSHIPS);
+                fetched when not given
+        """
+        if organization is None:
+            organization = OrganizationService.get_organization(
+                db, organization_id, relationships=CHECKLIST_RELATIONSHIPS
+            )
+        
+        # Read each required attribute once; loaded values come straight from the instance state
+        loaded = inspect(organization).dict
+        values = {
+            key: loaded[key] if key in loaded else getattr(organization, key)
+            for key in CHECKLIST_FIELDS
+        }
+        
+        # Completed steps are counted while building, so readiness needs no second pass
         steps = []
+        completed_steps = 0
+        for step_id, step_name, required_fields in CHECKLIST_STEPS:
+            missing_fields = tuple(field for field in required_fields if not values[field])
+            completed_steps += not missing_fields
+            steps.append(schemas.ChecklistItem(
+                step_id=step_id,
+                step_name=step_name,
+                is_completed=not missing_fields,
+                required_fields=required_fields,
+                # Left unset when empty so the route's exclude_unset dump omits it
+                **({"missing_fields": missing_fields} if missing_fields else {})
+            ))
         
-        # Step 1: Laboratory Details
-        step1_complete = all([
-            organization.lab_name,
-            organization.lab_address,
-            organization.lab_state,
-            organization.lab_district,
-            organization.lab_city,
-            organization.lab_pin_code
-        ])
-        steps.append(schemas.ChecklistItem(
-            step_id=1,
-            step_name="Laboratory Details",
-            is_completed=step1_complete,
-            required_fields=["lab_name", "lab_address", "lab_state", "lab_district", "lab_city", "lab_pin_code"],
-            missing_fields=[]
-        ))
-        
-        # Step 2: Registered Office & Top Management
-        step2_complete = bool(organization.registered_office) and len(organization.top_management) > 0
-        steps.append(schemas.ChecklistItem(
-            step_id=2,
-            step_name="Registered Office",
-            is_completed=step2_complete,
-            required_fields=["registered_office", "top_management"],
-            missing_fields=[]
-        ))
-        
-        # Step 3: Parent Organization & Bank Details
-        # These are optional, so we mark as complete by default
-        step3_complete = True
-        steps.append(schemas.ChecklistItem(
-            step_id=3,
-            step_name="Parent Organization",
-            is_completed=step3_complete,
-            required_fields=[],
-            missing_fields=[]
-        ))
-        
-        # Step 4: Working Schedule
-        step4_complete = bool(organization.working_schedule) and len(organization.shift_timings) > 0
-        steps.append(schemas.ChecklistItem(
-            step_id=4,
-            step_name="Working Days & Type",
-            is_completed=step4_complete,
-            required_fields=["working_schedule", "shift_timings"],
-            missing_fields=[]
-        ))
-        
-        # Step 5: Compliance Documents
-        # Optional, mark as complete
-        step5_complete = True
-        steps.append(schemas.ChecklistItem(
-            step_id=5,
-            step_name="Compliance Documents",
-            is_completed=step5_complete,
-            required_fields=[],
-            missing_fields=[]
-        ))
-        
-        # Step 6: Policy Documents
-        step6_complete = bool(organization.policy_documents)
-        steps.append(schemas.ChecklistItem(
-            step_id=6,
-            step_name="Undertakings & Policies",
-            is_completed=step6_complete,
-            required_fields=["policy_documents"],
-            missing_fields=[]
-        ))
-        
-        # Step 7: Infrastructure
-        step7_complete = bool(organization.infrastructure)
-        steps.append(schemas.ChecklistItem(
-            step_id=7,
-            step_name="Power & Water Supply",
-            is_completed=step7_complete,
-            required_fields=["infrastructure"],
-            missing_fields=[]
-        ))
-        
-        # Step 8: Accreditation & Other Details
-        step8_complete = bool(organization.other_details)
-        steps.append(schemas.ChecklistItem(
-            step_id=8,
-            step_name="Accreditation & Other",
-            is_completed=step8_complete,
-            required_fields=["other_details"],
-            missing_fields=[]
-        ))
-        
-        # Step 9: Quality Manual & SOPs
-        step9_complete = bool(organization.quality_manual)
-        steps.append(schemas.ChecklistItem(
-            step_id=9,
-            step_name="Quality Manual & SOPs",
-            is_completed=step9_complete,
-            required_fields=["quality_manual"],
-            missing_fields=[]
-        ))
-        
-        # Step 10: Quality Formats & Procedures
-        # Optional, mark as complete
-        step10_complete = True
-        steps.append(schemas.ChecklistItem(
-            step_id=10,
-            step_name="Quality Formats & Procedures",
-            is_completed=step10_complete,
-            required_fields=[],
-            missing_fields=[]
-        ))
-        
-        completed_steps = sum(1 for step in steps if step.is_completed)
         overall_completion = (completed_steps / len(steps)) * 100 if steps else 0
         
         return schemas.ChecklistResponse(
             organization_id=organization_id,
             overall_completion=overall_completion,
-            is_ready_for_submission=all(step.is_completed for step in steps),
+            is_ready_for_submission=completed_steps == len(steps),
             steps=steps
         )
     
     @staticmethod
     def submit_organization(db: Session, organization_id: UUID) -> models.Organization:
         """Submit organization for approval"""
-        organization = OrganizationService.get_organization(db, organization_id)
+        organization = OrganizationService.get_organization(
+            db, organization_id, relationships=CHECKLIST_RELATIONSHIPS
+        )
         
         # Validate completeness
-        checklist = OrganizationService.get_checklist(db, organization_id)
+        checklist = OrganizationService.get_checklist(db, organization_id, organization=organization)
         if not checklist.is_ready_for_submission:
             raise BadRequestException("Organization is not complete. Please fill all required fields.")
         
         organization.status = models.OrganizationStatus.SUBMITTED
         db.commit()
-        db.refresh(organization)
+        # Only the onupdate timestamp is unknown after the commit
+        db.refresh(organization, attribute_names=["updated_at"])
         
         return organization
+
+
+# Step tag -> update method, used by OrganizationService.update_step
+STEP_UPDATERS = {
+    "laboratory_details": OrganizationService.update_laboratory_details,
+    "registered_office": OrganizationService.update_registered_office,
+    "parent_organization": OrganizationService.update_parent_organization,
+    "bank_details": OrganizationService.update_bank_details,
+    "working_schedule": OrganizationService.update_working_schedule,
+    "compliance_documents": OrganizationService.update_compliance_documents,
+    "policy_documents": OrganizationService.update_policy_documents,
+    "infrastructure": OrganizationService.update_infrastructure,
+    "accreditation": OrganizationService.update_accreditation_documents,
+    "other_details": OrganizationService.update_other_lab_details,
+    "quality_manual": OrganizationService.update_quality_manual,
+    "quality_formats": OrganizationService.update_quality_formats,
+}
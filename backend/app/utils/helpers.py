@@ -2,19 +2,35 @@
 Helper Functions
 General utility functions
 """
+import re
+import time
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
+# Characters stripped from uploaded filenames, and the space -> underscore table
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^\w\s.-]')
+_SPACE_TO_UNDERSCORE = str.maketrans({' ': '_'})
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# (epoch second, formatted timestamp) of the last sanitize_filename call;
+# swapped as one tuple so threadpool callers never see a torn pair
+_filename_timestamp = (0, '')
+
 
 def generate_uuid() -> str:
-    """Generate a new UUID"""
+    """Generate a new UUID (canonical dashed form, as stored in UUID columns)"""
     return str(uuid.uuid4())
 
 
 def get_current_timestamp() -> datetime:
-    """Get current UTC timestamp"""
-    return datetime.utcnow()
+    """Get current UTC timestamp (naive, matching the models' UTC defaults)"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def clean_filename(filename: str) -> str:
+    """Strip special characters from a filename and replace spaces with underscores"""
+    return _UNSAFE_FILENAME_CHARS.sub('', filename).translate(_SPACE_TO_UNDERSCORE)
 
 
 def sanitize_filename(filename: str, prefix: Optional[str] = None) -> str:
@@ -29,12 +45,15 @@ def sanitize_filename(filename: str, prefix: Optional[str] = None) -> str:
         Sanitized filename with optional prefix
     """
     # Remove special characters and spaces
-    import re
-    filename = re.sub(r'[^\w\s.-]', '', filename)
-    filename = filename.replace(' ', '_')
+    filename = clean_filename(filename)
     
-    # Add timestamp to make unique
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    # Add timestamp to make unique (formatted at most once per second)
+    global _filename_timestamp
+    now = int(time.time())
+    cached_second, timestamp = _filename_timestamp
+    if now != cached_second:
+        timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(now))
+        _filename_timestamp = (now, timestamp)
     name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
     
     # Build filename with optional prefix
@@ -56,11 +75,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string
     """
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def get_file_extension(filename: str) -> Optional[str]:
@@ -5,6 +5,10 @@ Validation utilities for data validation
 import re
 from typing import Optional
 
+# Fixed-format codes are checked with positional str tests (ASCII only);
+# only the free-form mobile input still goes through a regex to strip separators
+_MOBILE_STRIP_RE = re.compile(r'[^\d+]')
+
 
 def validate_pin_code(pin_code: str) -> bool:
     """
@@ -16,8 +20,7 @@ def validate_pin_code(pin_code: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^\d{6}$'
-    return bool(re.match(pattern, pin_code))
+    return len(pin_code) == 6 and pin_code.isascii() and pin_code.isdigit()
 
 
 def validate_mobile_number(mobile: str) -> bool:
@@ -31,16 +34,14 @@ def validate_mobile_number(mobile: str) -> bool:
         True if valid, False otherwise
     """
     # Remove spaces and special characters
-    cleaned = re.sub(r'[^\d+]', '', mobile)
-    
-    # Check for Indian mobile number patterns
-    patterns = [
-        r'^\+91\d{10}$',  # +91XXXXXXXXXX
-        r'^91\d{10}$',    # 91XXXXXXXXXX
-        r'^\d{10}$'       # XXXXXXXXXX
-    ]
+    cleaned = _MOBILE_STRIP_RE.sub('', mobile)
     
-    return any(re.match(pattern, cleaned) for pattern in patterns)
+    # Accept +91XXXXXXXXXX, 91XXXXXXXXXX or XXXXXXXXXX
+    if cleaned.startswith('+91'):
+        cleaned = cleaned[3:]
+    elif len(cleaned) == 12 and cleaned.startswith('91'):
+        cleaned = cleaned[2:]
+    return len(cleaned) == 10 and cleaned.isascii() and cleaned.isdigit()
 
 
 def validate_ifsc_code(ifsc: str) -> bool:
@@ -53,8 +54,12 @@ def validate_ifsc_code(ifsc: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[A-Z]{4}0[A-Z0-9]{6}$'
-    return bool(re.match(pattern, ifsc.upper()))
+    # AAAA0XXXXXX: 4 letters, a zero, 6 letters/digits
+    ifsc = ifsc.upper()
+    return (
+        len(ifsc) == 11 and ifsc.isascii()
+        and ifsc[:4].isalpha() and ifsc[4] == '0' and ifsc[5:].isalnum()
+    )
 
 
 def validate_gst_number(gst: str) -> bool:
@@ -67,8 +72,13 @@ def validate_gst_number(gst: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^\d{2}[A-Z]{5}\d{4}[A-Z]{1}[A-Z\d]{1}[Z]{1}[A-Z\d]{1}$'
-    return bool(re.match(pattern, gst.upper()))
+    # 99AAAAA9999A?Z?: state code, PAN, entity number, 'Z', checksum
+    gst = gst.upper()
+    return (
+        len(gst) == 15 and gst.isascii()
+        and gst[:2].isdigit() and gst[2:7].isalpha() and gst[7:11].isdigit()
+        and gst[11].isalpha() and gst[12].isalnum() and gst[13] == 'Z' and gst[14].isalnum()
+    )
 
 
 def validate_coordinates(latitude: Optional[str], longitude: Optional[str]) -> bool:
@@ -3,83 +3,91 @@ Database Diagnostic Tool
 Check if data is actually being saved to the database
 """
 import os
-from sqlalchemy import create_engine, text
-from dotenv import load_dotenv
-
-# Load environment variables
-load_dotenv()
-
-DATABASE_URL = os.getenv("DATABASE_URL")
-
-if not DATABASE_URL:
-    print("❌ ERROR: DATABASE_URL not found in .env file")
-    exit(1)
-
-print("=" * 60)
-print("🔍 Database Diagnostic Tool")
-print("=" * 60)
-
-try:
-    # Create engine
-    engine = create_engine(DATABASE_URL)
-    
-    # Test connection
-    with engine.connect() as conn:
-        print("\n✅ Database connection successful!")
-        
-        # Check if organizations table exists
-        result = conn.execute(text("""
-            SELECT EXISTS (
-                SELECT FROM information_schema.tables 
-                WHERE table_name = 'organizations'
-            );
-        """))
-        
-        table_exists = result.scalar()
-        
-        if table_exists:
-            print("✅ 'organizations' table exists")
-            
-            # Count organizations
-            result = conn.execute(text("SELECT COUNT(*) FROM organizations"))
-            count = result.scalar()
-            
-            print(f"\n📊 Total organizations in database: {count}")
-            
-            if count > 0:
-                # Show recent organizations
-                result = conn.execute(text("""
-                    SELECT id, lab_name, lab_city, lab_state, status, created_at 
-                    FROM organizations 
-                    ORDER BY created_at DESC 
+from sqlalchemy import text
+from sqlalchemy.exc import ProgrammingError
+
+# PostgreSQL SQLSTATE for "relation does not exist"
+UNDEFINED_TABLE = "42P01"
+
+
+def main():
+    # Load environment variables (dotenv is only needed when run as a script)
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    DATABASE_URL = os.getenv("DATABASE_URL")
+
+    if not DATABASE_URL:
+        print("❌ ERROR: DATABASE_URL not found in .env file")
+        exit(1)
+
+    print("=" * 60)
+    print("🔍 Database Diagnostic Tool")
+    print("=" * 60)
+
+    try:
+        # Use the app's engine so the check runs with the same pool and driver options
+        from app.core.database import engine
+
+        # Test connection
+        with engine.connect() as conn:
+            print("\n✅ Database connection successful!")
+
+            # One round-trip: recent rows plus the total via a window function.
+            # A missing table surfaces as undefined_table (42P01) instead of a pre-check
+            try:
+                rows = conn.execute(text("""
+                    SELECT COUNT(*) OVER () AS total, id, lab_name, lab_city, lab_state, status, created_at
+                    FROM organizations
+                    ORDER BY created_at DESC
                     LIMIT 5
-                """))
-                
-                print("\n📋 Recent organizations:")
-                print("-" * 60)
-                for row in result:
-                    print(f"  ID: {row[0]}")
-                    print(f"  Name: {row[1]}")
-                    print(f"  City: {row[2]}, State: {row[3]}")
-                    print(f"  Status: {row[4]}")
-                    print(f"  Created: {row[5]}")
+                """)).all()
+                table_exists = True
+            except ProgrammingError as e:
+                if getattr(e.orig, "pgcode", None) != UNDEFINED_TABLE:
+                    raise
+                table_exists = False
+
+            if table_exists:
+                print("✅ 'organizations' table exists")
+
+                # Count organizations
+                count = rows[0].total if rows else 0
+
+                print(f"\n📊 Total organizations in database: {count}")
+
+                if count > 0:
+                    # Show recent organizations
+                    print("\n📋 Recent organizations:")
                     print("-" * 60)
+                    for row in rows:
+                        print(f"  ID: {row.id}")
+                        print(f"  Name: {row.lab_name}")
+                        print(f"  City: {row.lab_city}, State: {row.lab_state}")
+                        print(f"  Status: {row.status}")
+                        print(f"  Created: {row.created_at}")
+                        print("-" * 60)
+                else:
+                    print("\n⚠️  No organizations found in database")
+                    print("   This means data is NOT being saved!")
+                    print("\n💡 Possible issues:")
+                    print("   1. Frontend is not calling the API")
+                    print("   2. API is returning errors")
+                    print("   3. CORS is blocking requests")
             else:
-                print("\n⚠️  No organizations found in database")
-                print("   This means data is NOT being saved!")
-                print("\n💡 Possible issues:")
-                print("   1. Frontend is not calling the API")
-                print("   2. API is returning errors")
-                print("   3. CORS is blocking requests")
-        else:
-            print("❌ 'organizations' table does NOT exist")
-            print("   Run the backend server to create tables automatically")
-            
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    print("\nMake sure:")
-    print("  1. DATABASE_URL in .env is correct")
-    print("  2. Database is accessible")
-    print("  3. Backend has been started at least once")
-
-print("\n" + "=" * 60)
+                print("❌ 'organizations' table does NOT exist")
+                print("   Start the backend with ENVIRONMENT=development to create tables")
+                print("   automatically, or create the schema explicitly in other environments")
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        print("\nMake sure:")
+        print("  1. DATABASE_URL in .env is correct")
+        print("  2. Database is accessible")
+        print("  3. Tables exist (created on startup only when ENVIRONMENT=development)")
+
+    print("\n" + "=" * 60)
+
+
+if __name__ == "__main__":
+    main()
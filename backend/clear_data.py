@@ -2,107 +2,232 @@
 Clear Database and Upload Folder
 Resets the system for fresh testing
 """
+import argparse
+import functools
 import os
 import shutil
-from sqlalchemy import create_engine, text
-from dotenv import load_dotenv
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import create_engine, inspect, text
 
-# Load environment variables
-load_dotenv()
-
-DATABASE_URL = os.getenv("DATABASE_URL")
 UPLOAD_DIR = "./uploads"
 
-if not DATABASE_URL:
-    print("❌ ERROR: DATABASE_URL not found in .env file")
-    exit(1)
-
-print("=" * 60)
-print("🧹 Clear Database and Upload Folder")
-print("=" * 60)
-
-# Confirm action
-print("\n⚠️  WARNING: This will:")
-print("   1. Delete ALL organizations from the database")
-print("   2. Delete ALL uploaded files")
-print("   3. Clear localStorage organizationId")
-print()
-response = input("Are you sure you want to continue? (yes/no): ")
-
-if response.lower() != 'yes':
-    print("\n❌ Operation cancelled")
-    exit(0)
-
-try:
-    # Create engine
-    engine = create_engine(DATABASE_URL)
-    
-    # Clear database
-    print("\n🗑️  Clearing database...")
-    with engine.connect() as conn:
-        # Delete in reverse order of dependencies
-        tables = [
-            'quality_procedures',
-            'quality_formats',
-            'sops',
-            'quality_manuals',
-            'other_lab_details',
-            'accreditation_documents',
-            'infrastructure_details',
-            'policy_documents',
-            'compliance_documents',
-            'shift_timings',
-            'working_schedules',
-            'bank_details',
-            'parent_organizations',
-            'top_management',
-            'registered_offices',
-            'organizations'
-        ]
-        
-        for table in tables:
-            try:
-                result = conn.execute(text(f"DELETE FROM {table}"))
-                conn.commit()
-                print(f"   ✅ Cleared {table}")
-            except Exception as e:
-                print(f"   ⚠️  {table}: {str(e)}")
-    
-    # Clear upload folder
+# Tables to clear. The root table comes first: where the database enforces the
+# foreign keys, its DELETE cascades to the child tables (ON DELETE CASCADE); the
+# later DELETEs in the fallback remove whatever rows are left (e.g. on SQLite,
+# where foreign keys are off by default)
+TABLES = (
+    'organizations',
+    'quality_procedures',
+    'quality_formats',
+    'sops',
+    'quality_manuals',
+    'other_lab_details',
+    'accreditation_documents',
+    'infrastructure_details',
+    'policy_documents',
+    'compliance_documents',
+    'shift_timings',
+    'working_schedules',
+    'bank_details',
+    'parent_organizations',
+    'top_management',
+    'registered_offices'
+)
+
+# DELETE statements for the non-PostgreSQL fallback, built once rather than per run of the loop
+DELETE_STATEMENTS = tuple((table, text(f"DELETE FROM {table}")) for table in TABLES)
+
+
+def find_non_empty_tables(conn):
+    """
+    Names of the tables that still hold rows, probed in one round trip
+
+    Only tables that exist are probed, so a missing table (e.g. an older schema)
+    is reported and skipped instead of failing the whole query.
+    """
+    existing = set(inspect(conn).get_table_names())
+    for table in TABLES:
+        if table not in existing:
+            print(f"   ⚠️  {table}: table does not exist, skipped")
+    probes = [
+        f"SELECT '{table}' AS name WHERE EXISTS (SELECT 1 FROM {table})"
+        for table in TABLES if table in existing
+    ]
+    if not probes:
+        return set()
+    return set(conn.execute(text(" UNION ALL ".join(probes))).scalars())
+
+
+# Where supported (Linux/macOS), delete names relative to one open directory fd
+# instead of resolving the full upload path again for every entry
+USE_DIR_FD = (
+    os.scandir in os.supports_fd
+    and os.unlink in os.supports_dir_fd
+    and shutil.rmtree.avoids_symlink_attacks
+)
+
+
+def delete_upload(entry, dir_fd=None):
+    """Delete one top-level upload entry (file or directory tree); returns the error, if any"""
+    try:
+        # DirEntry type comes from the directory listing, so no extra stat() per item
+        if entry.is_dir(follow_symlinks=False):
+            shutil.rmtree(entry.path, dir_fd=dir_fd)
+        else:
+            os.unlink(entry.path, dir_fd=dir_fd)
+    except Exception as e:
+        return entry.name, e
+    return None
+
+
+def clear_uploads():
+    """
+    Empty the upload folder and recreate its subdirectories
+
+    Returns (per-entry results, or None if the folder doesn't exist; seconds taken)
+    """
+    started = time.perf_counter()
+    if not os.path.exists(UPLOAD_DIR):
+        return None, time.perf_counter() - started
+
+    # Deletion is syscall-bound, so overlapping entries across threads pays off
+    dir_fd = os.open(UPLOAD_DIR, os.O_RDONLY | os.O_DIRECTORY) if USE_DIR_FD else None
+    try:
+        with os.scandir(UPLOAD_DIR if dir_fd is None else dir_fd) as entries, \
+                ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 4) * 4)) as executor:
+            results = list(executor.map(lambda entry: delete_upload(entry, dir_fd), entries))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    # Recreate subdirectories
+    os.makedirs(os.path.join(UPLOAD_DIR, "logos"), exist_ok=True)
+    os.makedirs(os.path.join(UPLOAD_DIR, "documents"), exist_ok=True)
+    return results, time.perf_counter() - started
+
+
+def report_upload_clear(uploads_cleared):
+    """Print the outcome of the background upload cleanup; returns True if it completed"""
     print("\n🗑️  Clearing upload folder...")
-    if os.path.exists(UPLOAD_DIR):
-        for item in os.listdir(UPLOAD_DIR):
-            item_path = os.path.join(UPLOAD_DIR, item)
-            try:
-                if os.path.isfile(item_path):
-                    os.unlink(item_path)
-                elif os.path.isdir(item_path):
-                    shutil.rmtree(item_path)
-                print(f"   ✅ Deleted {item}")
-            except Exception as e:
-                print(f"   ⚠️  Error deleting {item}: {e}")
-        
-        # Recreate subdirectories
-        os.makedirs(os.path.join(UPLOAD_DIR, "logos"), exist_ok=True)
-        os.makedirs(os.path.join(UPLOAD_DIR, "documents"), exist_ok=True)
+    try:
+        results, uploads_seconds = uploads_cleared.result()
+    except Exception as e:
+        print(f"   ❌ Error clearing upload folder: {e}")
+        return False
+
+    if results is not None:
+        # One summary line instead of a terminal write per deleted item; failures still listed
+        errors = [result for result in results if result is not None]
+        for item, e in errors:
+            print(f"   ⚠️  Error deleting {item}: {e}")
+        print(f"   ✅ Deleted {len(results) - len(errors)} items ({len(errors)} errors)")
         print("   ✅ Recreated upload directories")
     else:
         print("   ℹ️  Upload folder doesn't exist")
-    
-    print("\n" + "=" * 60)
-    print("✅ Database and upload folder cleared successfully!")
+    print(f"   ⏱️  Upload folder cleared in {uploads_seconds:.2f}s")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def load_database_url():
+    """Read DATABASE_URL, parsing .env only on the first call"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv("DATABASE_URL")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Clear the database and upload folder")
+    parser.add_argument("-y", "--yes", action="store_true", help="skip the confirmation prompt (for CI)")
+    args = parser.parse_args()
+
+    database_url = load_database_url()
+    if not database_url:
+        print("❌ ERROR: DATABASE_URL not found in .env file")
+        exit(1)
+
+    print("=" * 60)
+    print("🧹 Clear Database and Upload Folder")
     print("=" * 60)
-    print("\n💡 Next steps:")
-    print("   1. Clear browser localStorage (F12 → Application → Local Storage → Clear)")
-    print("   2. Refresh your React app")
-    print("   3. Start fresh testing!")
+
+    # Confirm action
+    print("\n⚠️  WARNING: This will:")
+    print("   1. Delete ALL organizations from the database")
+    print("   2. Delete ALL uploaded files")
+    print("   3. Clear localStorage organizationId")
     print()
-    
-except Exception as e:
-    print(f"\n❌ Error: {e}")
-    print("\nMake sure:")
-    print("  1. DATABASE_URL in .env is correct")
-    print("  2. Database is accessible")
-    print("  3. Backend is not running (stop it first)")
-
-print("=" * 60)
+    if not args.yes:
+        response = input("Are you sure you want to continue? (yes/no): ")
+
+        if response.lower() != 'yes':
+            print("\n❌ Operation cancelled")
+            exit(0)
+
+    uploads_cleared = None
+    database_cleared = False
+    try:
+        # Create engine
+        db_started = time.perf_counter()
+        engine = create_engine(database_url)
+
+        # Clear database
+        print("\n🗑️  Clearing database...")
+        with engine.connect() as conn:
+            # Already-empty tables are skipped, so clearing a clean database writes nothing
+            non_empty = find_non_empty_tables(conn)
+
+            # The database is reachable, so clear uploads in the background while it is
+            # cleared; results are printed afterwards so the two logs don't interleave
+            uploads_executor = ThreadPoolExecutor(max_workers=1)
+            uploads_cleared = uploads_executor.submit(clear_uploads)
+            uploads_executor.shutdown(wait=False)
+
+            if not non_empty:
+                print("   ℹ️  All tables are already empty")
+            elif engine.dialect.name == "postgresql":
+                # One statement and one commit for every table; CASCADE covers the foreign keys
+                names = [table for table in TABLES if table in non_empty]
+                conn.execute(text(f"TRUNCATE TABLE {', '.join(names)} RESTART IDENTITY CASCADE"))
+                conn.commit()
+                print(f"   ✅ Cleared {len(names)} tables")
+            else:
+                # No TRUNCATE elsewhere (e.g. SQLite): delete table by table, committing once
+                for table, statement in DELETE_STATEMENTS:
+                    if table not in non_empty:
+                        continue
+                    try:
+                        result = conn.execute(statement)
+                        print(f"   ✅ Cleared {table} ({result.rowcount} rows)")
+                    except Exception as e:
+                        print(f"   ⚠️  {table}: {str(e)}")
+                conn.commit()
+        print(f"   ⏱️  Database cleared in {time.perf_counter() - db_started:.2f}s")
+        database_cleared = True
+
+    except Exception as e:
+        print(f"\n❌ Error: {e}")
+        print("\nMake sure:")
+        print("  1. DATABASE_URL in .env is correct")
+        print("  2. Database is accessible")
+        print("  3. Backend is not running (stop it first)")
+
+    finally:
+        # Always report the upload cleanup once it has started, even if the database failed
+        uploads_ok = uploads_cleared is not None and report_upload_clear(uploads_cleared)
+
+    if database_cleared and uploads_ok:
+        print("\n" + "=" * 60)
+        print("✅ Database and upload folder cleared successfully!")
+        print("=" * 60)
+        print("\n💡 Next steps:")
+        print("   1. Clear browser localStorage (F12 → Application → Local Storage → Clear)")
+        print("   2. Refresh your React app")
+        print("   3. Start fresh testing!")
+        print()
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()